@@ -10,6 +10,7 @@ Features:
 
 import asyncio
 import logging
+import time
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, date, time as dt_time, timedelta
@@ -22,7 +23,7 @@ logger = logging.getLogger(__name__)
 BUCKET_MINUTES = 30
 
 
-@dataclass
+@dataclass(slots=True)
 class BucketStats:
     """Stats for a single 30-minute bucket."""
     symbol: str
@@ -75,6 +76,8 @@ class BucketAggregator:
         self._current_bucket: dict[str, BucketStats] = {}
         self._current_bucket_start: Optional[dt_time] = None
         self._current_date: Optional[date] = None
+        self._bucket_end_ts = 0.0  # Epoch end of the current bucket (live trades only)
+        self._retry_buckets: list[BucketStats] = []  # Failed flush, retried next flush
 
         # Metrics
         self._total_trades = 0
@@ -123,15 +126,32 @@ class BucketAggregator:
         Returns:
             True if bucket boundary was crossed (flush needed)
         """
-        now = timestamp or datetime.now()
         self._total_trades += 1
 
-        # Check for bucket boundary
-        boundary_crossed = self._check_bucket_boundary(now)
+        if timestamp is None and time.time() < self._bucket_end_ts:
+            # Still inside the current bucket: skip datetime/bucket math
+            boundary_crossed = False
+            bucket_start = self._current_bucket_start
+            trade_date = self._current_date
+        else:
+            now = timestamp or datetime.now()
+
+            # Check for bucket boundary
+            boundary_crossed = self._check_bucket_boundary(now)
+
+            bucket_start = self._get_bucket_start(now)
+            trade_date = now.date()
+
+            # Explicit timestamps may jump around, so only cache the end of
+            # live (wall-clock) buckets
+            if timestamp is None:
+                bucket_end = datetime.combine(trade_date, bucket_start) + timedelta(
+                    minutes=self.bucket_minutes)
+                self._bucket_end_ts = bucket_end.timestamp()
+            else:
+                self._bucket_end_ts = 0.0
 
         # Initialize bucket if needed
-        bucket_start = self._get_bucket_start(now)
-        trade_date = now.date()
 
         if underlying not in self._current_bucket:
             self._current_bucket[underlying] = BucketStats(
@@ -161,19 +181,34 @@ class BucketAggregator:
 
         return boundary_crossed
 
-    async def flush(self) -> int:
+    def take_bucket(self) -> list[BucketStats]:
+        """
+        Detach the current bucket's stats for flushing.
+
+        Synchronous, so trades added afterwards always start a fresh bucket
+        even if the flush itself runs later in a background task.
+        """
+        buckets = list(self._current_bucket.values())
+        self._current_bucket.clear()
+        return buckets
+
+    async def flush(self, buckets: Optional[list[BucketStats]] = None) -> int:
         """
         Flush current bucket to database.
 
+        Args:
+            buckets: Stats already detached with take_bucket() (default: detach now)
+
         Returns:
             Number of rows inserted
         """
-        if not self._current_bucket:
+        if buckets is None:
+            buckets = self.take_bucket()
+        buckets_to_insert = self._retry_buckets + buckets
+        self._retry_buckets = []
+        if not buckets_to_insert:
             return 0
 
-        buckets_to_insert = list(self._current_bucket.values())
-        self._current_bucket.clear()
-
         if not self.db_pool:
             logger.warning("No db_pool, skipping flush")
             return 0
@@ -209,9 +244,9 @@ class BucketAggregator:
 
         except Exception as e:
             logger.error(f"Bucket flush failed: {e}")
-            # Re-add to bucket for retry
-            for b in buckets_to_insert:
-                self._current_bucket[b.symbol] = b
+            # Retry with the next flush (not via the live bucket, which may
+            # already hold new stats for the same symbols)
+            self._retry_buckets = buckets_to_insert
             return 0
 
     def get_pending_count(self) -> int:
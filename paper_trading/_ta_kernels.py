@@ -0,0 +1,104 @@
+"""
+TA Kernels
+
+Inner loops for TA in SignalGenerator and the premarket TA cache. Compiled
+with numba when it is installed; otherwise the same functions run as plain
+Python, so the results are identical either way.
+"""
+
+from typing import List, Optional, Sequence
+
+try:
+    import numpy as np
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        def wrap(fn):
+            return fn
+        return wrap
+
+
+@njit(cache=True, nogil=True)
+def _rsi_kernel(closes, period):
+    """Simple-average RSI over the last `period` changes (single pass, no temporaries)."""
+    n = len(closes)
+    gain = 0.0
+    loss = 0.0
+    for i in range(n - period, n):
+        change = closes[i] - closes[i - 1]
+        if change > 0:
+            gain += change
+        elif change < 0:
+            loss -= change
+    avg_gain = gain / period
+    avg_loss = loss / period
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+def rsi(closes: Sequence[float], period: int = 14) -> Optional[float]:
+    """RSI from closing prices, rounded to 2 decimals. None if too few closes."""
+    if len(closes) < period + 1:
+        return None
+    data = np.asarray(closes, dtype=np.float64) if HAS_NUMBA else closes
+    return round(float(_rsi_kernel(data, period)), 2)
+
+
+@njit(cache=True, nogil=True)
+def _sma_kernel(prices, period):
+    """Mean of the last `period` prices, summed in order (no slice copy)."""
+    n = len(prices)
+    total = 0.0
+    for i in range(n - period, n):
+        total += prices[i]
+    return total / period
+
+
+def sma(prices: Sequence[float], period: int) -> Optional[float]:
+    """SMA of the last `period` prices, rounded to 4 decimals. None if too few prices."""
+    if len(prices) < period:
+        return None
+    data = np.asarray(prices, dtype=np.float64) if HAS_NUMBA else prices
+    return round(float(_sma_kernel(data, period)), 4)
+
+
+@njit(cache=True, nogil=True)
+def _ema_series_kernel(prices, period, out):
+    """SMA-seeded EMA after each bar from index period-1 on, written into out (unrounded)."""
+    ema = 0.0
+    for i in range(period):
+        ema += prices[i]
+    ema /= period
+    k = 2 / (period + 1)
+    out[0] = ema
+    for i in range(period, len(prices)):
+        ema = prices[i] * k + ema * (1 - k)
+        out[i - period + 1] = ema
+
+
+def ema_prefix_series(prices: Sequence[float], period: int) -> List[float]:
+    """Unrounded EMA of every prefix prices[:i] for i >= period ([] if too few prices)."""
+    m = len(prices) - period + 1
+    if m <= 0:
+        return []
+    if HAS_NUMBA:
+        out = np.empty(m, dtype=np.float64)
+        _ema_series_kernel(np.asarray(prices, dtype=np.float64), period, out)
+        return out.tolist()
+    out = [0.0] * m
+    _ema_series_kernel(prices, period, out)
+    return out
+
+
+def warmup():
+    """Compile kernels ahead of the first live signal (no-op without numba)."""
+    if HAS_NUMBA:
+        rsi([float(i) for i in range(16)], 14)
+        sma([float(i) for i in range(16)], 12)
+        ema_prefix_series([float(i) for i in range(16)], 12)
@@ -49,6 +49,7 @@ class Position:
     unrealized_plpc: float
     current_price: float
     side: str  # 'long' or 'short'
+    shares: int = 0  # int(qty), converted once at parse time
 
 
 @dataclass
@@ -148,19 +149,7 @@ class AlpacaTrader:
             async with session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
-                    positions = []
-                    for p in data:
-                        positions.append(Position(
-                            symbol=p.get("symbol"),
-                            qty=float(p.get("qty", 0)),
-                            avg_entry_price=float(p.get("avg_entry_price", 0)),
-                            market_value=float(p.get("market_value", 0)),
-                            unrealized_pl=float(p.get("unrealized_pl", 0)),
-                            unrealized_plpc=float(p.get("unrealized_plpc", 0)),
-                            current_price=float(p.get("current_price", 0)),
-                            side=p.get("side", "long"),
-                        ))
-                    return positions
+                    return [self._parse_position(p) for p in data]
                 else:
                     text = await response.text()
                     logger.error(f"Failed to get positions: {response.status} - {text}")
@@ -177,17 +166,7 @@ class AlpacaTrader:
         try:
             async with session.get(url) as response:
                 if response.status == 200:
-                    p = await response.json()
-                    return Position(
-                        symbol=p.get("symbol"),
-                        qty=float(p.get("qty", 0)),
-                        avg_entry_price=float(p.get("avg_entry_price", 0)),
-                        market_value=float(p.get("market_value", 0)),
-                        unrealized_pl=float(p.get("unrealized_pl", 0)),
-                        unrealized_plpc=float(p.get("unrealized_plpc", 0)),
-                        current_price=float(p.get("current_price", 0)),
-                        side=p.get("side", "long"),
-                    )
+                    return self._parse_position(await response.json())
                 elif response.status == 404:
                     return None  # No position
                 else:
@@ -379,6 +358,30 @@ class AlpacaTrader:
             logger.error(f"Error getting order {order_id}: {e}")
             return None
 
+    async def wait_for_fill(self, order_id: str, timeout: float) -> Optional[Order]:
+        """
+        Poll an order until it is filled, canceled or rejected.
+
+        Polls at 100ms, backing off to 1s, so a fast fill is seen within
+        ~100ms instead of after a fixed sleep. Returns the last order seen
+        (possibly partially filled or None) if the timeout expires first.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.1
+        order = None
+        while True:
+            await asyncio.sleep(delay)
+            order = await self.get_order(order_id) or order
+            if order and order.status in (
+                OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.REJECTED,
+            ):
+                return order
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return order
+            delay = min(delay * 2, 1.0, remaining)
+
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order."""
         session = await self._get_session()
@@ -413,6 +416,36 @@ class AlpacaTrader:
             logger.error(f"Error getting price {symbol}: {e}")
             return None
 
+    async def get_latest_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        Get latest trade prices for several symbols in one request.
+
+        Symbols missing from the response are omitted from the result.
+        """
+        if not symbols:
+            return {}
+
+        session = await self._get_session()
+        url = f"{self.config.ALPACA_DATA_URL}/stocks/trades/latest"
+        params = {"symbols": ",".join(symbols)}
+
+        try:
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return {
+                        sym: float(trade["p"])
+                        for sym, trade in data.get("trades", {}).items()
+                        if trade.get("p")
+                    }
+                else:
+                    text = await response.text()
+                    logger.error(f"Batch price fetch failed: {response.status} - {text}")
+                    return {}
+        except Exception as e:
+            logger.error(f"Error getting prices for {len(symbols)} symbols: {e}")
+            return {}
+
     async def get_all_orders(
         self,
         status: str = "all",
@@ -476,6 +509,21 @@ class AlpacaTrader:
             logger.error(f"Error fetching all orders: {e}")
             return all_orders
 
+    def _parse_position(self, data: dict) -> Position:
+        """Parse position response."""
+        qty = float(data.get("qty", 0))
+        return Position(
+            symbol=data.get("symbol"),
+            qty=qty,
+            avg_entry_price=float(data.get("avg_entry_price", 0)),
+            market_value=float(data.get("market_value", 0)),
+            unrealized_pl=float(data.get("unrealized_pl", 0)),
+            unrealized_plpc=float(data.get("unrealized_plpc", 0)),
+            current_price=float(data.get("current_price", 0)),
+            side=data.get("side", "long"),
+            shares=int(qty),
+        )
+
     def _parse_order(self, data: dict) -> Optional[Order]:
         """Parse order response."""
         if not data:
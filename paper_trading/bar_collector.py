@@ -14,7 +14,7 @@ import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 import aiohttp
 
@@ -54,11 +54,14 @@ class IntradayBarCollector:
         secret_key: str,
         db_pool=None,
         max_batches: int = 2,
+        session_factory: Optional[Callable[[], Awaitable[aiohttp.ClientSession]]] = None,
     ):
         self.api_key = api_key
         self.secret_key = secret_key
-        self.db_pool = db_pool
+        self.db_pool = db_pool  # Owned by the caller
         self.max_batches = max_batches
+        # Borrow a session owned elsewhere (same API keys) instead of opening one
+        self._session_factory = session_factory
 
         self._session: Optional[aiohttp.ClientSession] = None
         self._buffer: list[BarRecord] = []
@@ -73,6 +76,8 @@ class IntradayBarCollector:
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
+        if self._session_factory is not None:
+            return await self._session_factory()
         if self._session is None or self._session.closed:
             self._session = aiohttp.ClientSession(
                 headers={
@@ -198,17 +203,32 @@ class IntradayBarCollector:
             return 0
 
         try:
-            async with self.db_pool.acquire() as conn:
-                rows = [
-                    (b.symbol, b.bar_ts, b.open, b.high, b.low, b.close,
-                     b.volume, b.vwap, b.trade_count)
-                    for b in bars_to_insert
-                ]
+            # One statement for the whole batch: columns are shipped as
+            # parallel arrays and unnested server-side
+            symbols, bar_ts, opens, highs, lows, closes = [], [], [], [], [], []
+            volumes, vwaps, trade_counts = [], [], []
+            # ON CONFLICT can't touch a row twice in one statement; keep the
+            # newest copy of each bar (buffer may hold re-queued bars)
+            unique_bars = {(b.symbol, b.bar_ts): b for b in bars_to_insert}
+            for b in unique_bars.values():
+                symbols.append(b.symbol)
+                bar_ts.append(b.bar_ts)
+                opens.append(b.open)
+                highs.append(b.high)
+                lows.append(b.low)
+                closes.append(b.close)
+                volumes.append(b.volume)
+                vwaps.append(b.vwap)
+                trade_counts.append(b.trade_count)
 
-                await conn.executemany("""
+            async with self.db_pool.acquire() as conn:
+                await conn.execute("""
                     INSERT INTO spot_prices_1m
                         (symbol, bar_ts, open, high, low, close, volume, vwap, trade_count)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                    SELECT * FROM unnest(
+                        $1::text[], $2::timestamptz[], $3::float8[], $4::float8[],
+                        $5::float8[], $6::float8[], $7::bigint[], $8::float8[], $9::int[]
+                    )
                     ON CONFLICT (symbol, bar_ts) DO UPDATE SET
                         open = EXCLUDED.open,
                         high = EXCLUDED.high,
@@ -217,12 +237,14 @@ class IntradayBarCollector:
                         volume = EXCLUDED.volume,
                         vwap = EXCLUDED.vwap,
                         trade_count = EXCLUDED.trade_count
-                """, rows)
+                """, symbols, bar_ts, opens, highs, lows, closes,
+                    volumes, vwaps, trade_counts)
+            n = len(unique_bars)
 
             self._total_flushes += 1
-            self._total_rows_inserted += len(rows)
-            logger.info(f"Bar collector: flushed {len(rows)} bars to spot_prices_1m")
-            return len(rows)
+            self._total_rows_inserted += n
+            logger.info(f"Bar collector: flushed {n} bars to spot_prices_1m")
+            return n
 
         except Exception as e:
             logger.error(f"Bar collector flush failed: {e}")
@@ -256,7 +278,7 @@ class IntradayBarCollector:
             return 0
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
+        """Close the aiohttp session (borrowed sessions are left to their owner)."""
         if self._session and not self._session.closed:
             await self._session.close()
 
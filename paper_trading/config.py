@@ -205,10 +205,17 @@ class TradingConfig:
     USE_STOCK_WEBSOCKET: bool = True  # Real-time SIP trades+quotes for event-driven hard stop detection
     WEBSOCKET_FALLBACK_TO_REST: bool = True  # Fall back to REST if WebSocket fails
     WEBSOCKET_MAX_RECONNECT_ATTEMPTS: int = 3  # Max reconnect attempts before fallback
+    PRICE_TRIGGER_WINDOW_SEC: float = 0.05  # Coalesce WebSocket ticks; evaluate stops once per window
+    TRADE_QUEUE_MAX: int = 10_000  # Firehose trades buffered ahead of processing (drops when full)
+    TRADE_WORKERS: int = 1  # Trade processing tasks (aggregators are unlocked; keep at 1)
+    TRADE_BATCH_MAX: int = 256  # Max queued trades a worker drains per aggregator call
+    TRADE_QUEUE_BACKPRESSURE: bool = False  # When full: True blocks the firehose read, False drops the trade
+    TRADE_QUEUE_DRAIN_SEC: float = 5.0  # Shutdown: max wait for queued trades to be processed
 
     # Position limits
     MAX_CONCURRENT_POSITIONS: int = 10
     MAX_POSITION_SIZE_PCT: float = 0.10  # 10% of portfolio per trade
+    MAX_COMPLETED_TRADES_MEMORY: int = 1000  # Closed trades kept in memory per day (all are in the DB)
 
     # Exit rules
     EXIT_TIME: dt_time = dt_time(15, 55)  # 3:55 PM ET
@@ -224,6 +231,7 @@ class TradingConfig:
     # Timing
     SIGNAL_CHECK_INTERVAL_SEC: int = 60  # Check for signals every minute
     POSITION_CHECK_INTERVAL_SEC: int = 30  # Check positions every 30s
+    DAILY_RESET_CHECK_SEC: float = 30.0  # Re-check for a new trading day in the trade loop every N seconds
 
     # Alpaca
     ALPACA_PAPER_URL: str = "https://paper-api.alpaca.markets"
@@ -238,6 +246,7 @@ class TradingConfig:
     INTRADAY_BARS_MAX_BATCHES: int = 55      # 55 × 100 = 5,500 symbols (covers 5,203 tracked + headroom)
     INTRADAY_BARS_INTERVAL_SEC: int = 60     # collect every 60 seconds
     INTRADAY_BARS_RETENTION_DAYS: int = 21   # 21 calendar days ≈ 14 trading days
+    TRACKED_SYMBOLS_CACHE_TTL_SEC: int = 300  # Watchlist cache TTL (NOTIFY invalidates sooner)
 
     # Logging
     LOG_FILE: str = "paper_trading.log"
@@ -7,6 +7,7 @@ Provides real-time dashboard via Google Sheets showing:
 - Closed trades for the day
 """
 
+import functools
 import logging
 import os
 from datetime import datetime
@@ -25,6 +26,66 @@ SHEET_ID = os.environ.get("DASHBOARD_SHEET_ID", "")
 CREDENTIALS_SECRET = "dashboard-credentials"  # Secret Manager key
 
 
+def _get_credentials_from_secret() -> Optional[str]:
+    """Try to fetch credentials from Secret Manager."""
+    try:
+        from google.cloud import secretmanager
+        client = secretmanager.SecretManagerServiceClient()
+        project = os.environ.get("GOOGLE_CLOUD_PROJECT", "fl3-v2-prod")
+        name = f"projects/{project}/secrets/{CREDENTIALS_SECRET}/versions/latest"
+        logger.info(f"Accessing secret: {name}")
+        response = client.access_secret_version(request={"name": name})
+        logger.info("Successfully retrieved credentials from Secret Manager")
+        return response.payload.data.decode("UTF-8")
+    except Exception as e:
+        logger.warning(f"Could not fetch credentials from Secret Manager: {e}")
+        return None
+
+
+@functools.cache
+def _open_sheet(sheet_id: str, credentials_json: Optional[str] = None):
+    """
+    Authorize gspread and open the sheet, once per (sheet, credentials).
+
+    The A/B/C dashboards share one sheet, so startup pays for a single
+    Secret Manager fetch and authorization instead of one per account.
+    Failures raise and are not cached, so a later Dashboard retries.
+    """
+    try:
+        import gspread
+        from google.oauth2.service_account import Credentials
+    except ImportError as e:
+        raise ImportError(f"gspread and google-auth required for dashboard: {e}")
+
+    scopes = ['https://www.googleapis.com/auth/spreadsheets']
+
+    # Try to get credentials from Secret Manager if not provided
+    if not credentials_json:
+        logger.info("Fetching dashboard credentials from Secret Manager...")
+        credentials_json = _get_credentials_from_secret()
+
+    if credentials_json:
+        import json
+        logger.info("Got credentials from Secret Manager, initializing gspread...")
+        creds_dict = json.loads(credentials_json)
+        creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
+    else:
+        # Fall back to default credentials (for local testing)
+        creds_file = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+        if creds_file:
+            logger.info(f"Using credentials file: {creds_file}")
+            creds = Credentials.from_service_account_file(creds_file, scopes=scopes)
+        else:
+            raise ValueError("No credentials available - Secret Manager returned None and no GOOGLE_APPLICATION_CREDENTIALS set")
+
+    logger.info("Authorizing gspread client...")
+    client = gspread.authorize(creds)
+    logger.info(f"Opening sheet by key: {sheet_id}")
+    sheet = client.open_by_key(sheet_id)
+    logger.info(f"Sheet opened: {sheet.title}")
+    return client, sheet
+
+
 class Dashboard:
     """
     Google Sheets dashboard for real-time paper trading visibility.
@@ -44,6 +105,8 @@ class Dashboard:
         self._positions_tab = None
         self._closed_tab = None
         self._enabled = False
+        # Rows last written by rewrite_positions; None when the tab was changed another way
+        self._positions_written: Optional[list] = None
 
         if not self.sheet_id:
             logger.warning("Dashboard disabled: DASHBOARD_SHEET_ID not set")
@@ -60,38 +123,8 @@ class Dashboard:
 
     def _init_client(self, credentials_json: Optional[str] = None):
         """Initialize Google Sheets client."""
-        try:
-            import gspread
-            from google.oauth2.service_account import Credentials
-        except ImportError as e:
-            raise ImportError(f"gspread and google-auth required for dashboard: {e}")
-
-        scopes = ['https://www.googleapis.com/auth/spreadsheets']
-
-        # Try to get credentials from Secret Manager if not provided
-        if not credentials_json:
-            logger.info("Fetching dashboard credentials from Secret Manager...")
-            credentials_json = self._get_credentials_from_secret()
-
-        if credentials_json:
-            import json
-            logger.info("Got credentials from Secret Manager, initializing gspread...")
-            creds_dict = json.loads(credentials_json)
-            creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-        else:
-            # Fall back to default credentials (for local testing)
-            creds_file = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
-            if creds_file:
-                logger.info(f"Using credentials file: {creds_file}")
-                creds = Credentials.from_service_account_file(creds_file, scopes=scopes)
-            else:
-                raise ValueError("No credentials available - Secret Manager returned None and no GOOGLE_APPLICATION_CREDENTIALS set")
-
-        logger.info("Authorizing gspread client...")
-        self._client = gspread.authorize(creds)
-        logger.info(f"Opening sheet by key: {self.sheet_id}")
-        self._sheet = self._client.open_by_key(self.sheet_id)
-        logger.info(f"Sheet opened: {self._sheet.title}")
+        # Authorized client/sheet are shared by every Dashboard on the same sheet
+        self._client, self._sheet = _open_sheet(self.sheet_id, credentials_json)
 
         # Get or create tabs (Account B uses prefixed tab names)
         logger.info("Getting/creating worksheets...")
@@ -105,21 +138,6 @@ class Dashboard:
             self._closed_tab = self._get_or_create_worksheet("Closed Today")
         logger.info("All worksheets ready")
 
-    def _get_credentials_from_secret(self) -> Optional[str]:
-        """Try to fetch credentials from Secret Manager."""
-        try:
-            from google.cloud import secretmanager
-            client = secretmanager.SecretManagerServiceClient()
-            project = os.environ.get("GOOGLE_CLOUD_PROJECT", "fl3-v2-prod")
-            name = f"projects/{project}/secrets/{CREDENTIALS_SECRET}/versions/latest"
-            logger.info(f"Accessing secret: {name}")
-            response = client.access_secret_version(request={"name": name})
-            logger.info("Successfully retrieved credentials from Secret Manager")
-            return response.payload.data.decode("UTF-8")
-        except Exception as e:
-            logger.warning(f"Could not fetch credentials from Secret Manager: {e}")
-            return None
-
     def _get_or_create_worksheet(self, title: str):
         """Get existing worksheet or create new one."""
         import gspread
@@ -207,6 +225,7 @@ class Dashboard:
         if not self._enabled:
             return
 
+        self._positions_written = None
         try:
             pnl = ((current_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0
             row = [
@@ -237,11 +256,16 @@ class Dashboard:
         Takes a list of [symbol, score, entry, current, pnl%, status] rows.
         Self-healing: removes stale entries that shouldn't be there.
         Uses USER_ENTERED so Google Sheets applies consistent formatting
-        to all rows regardless of prior cell formatting.
+        to all rows regardless of prior cell formatting. Skipped when the rows
+        match the previous rewrite and nothing else has touched the tab.
         """
         if not self._enabled:
             return
+        # Nothing changed since our last rewrite (prices are formatted to the cent)
+        if positions_data == self._positions_written:
+            return
 
+        self._positions_written = None
         try:
             self._positions_tab.clear()
             header = ['Symbol', 'Score', 'Entry', 'Current', 'P/L %', 'Status']
@@ -249,6 +273,7 @@ class Dashboard:
                 self._positions_tab.update('A1', [header] + positions_data, value_input_option='USER_ENTERED')
             else:
                 self._positions_tab.update('A1', [header], value_input_option='USER_ENTERED')
+            self._positions_written = positions_data
         except Exception as e:
             logger.warning(f"Dashboard rewrite_positions failed: {e}")
 
@@ -268,6 +293,7 @@ class Dashboard:
         if not self._enabled:
             return
 
+        self._positions_written = None
         try:
             ts = exit_time or datetime.now(ET)
             pnl_pct = ((exit_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0
@@ -307,6 +333,7 @@ class Dashboard:
         if not self._enabled:
             return
 
+        self._positions_written = None
         try:
             # Clear all tabs
             self._signals_tab.clear()
@@ -652,6 +679,77 @@ def log_trade_close(
         logger.warning(f"Failed to log trade close to DB: {e}")
 
 
+def log_trades_open_bulk(db_url: str, records: list, table_name: str = "paper_trades_log") -> list:
+    """
+    Log several trade opens in one statement (original columns only).
+
+    records: (symbol, entry_time, entry_price, shares, signal_score, signal_rsi,
+    signal_notional) tuples, one per symbol. Returns row ids in record order
+    (matched by symbol, since RETURNING order isn't guaranteed), all None on failure.
+    """
+    assert table_name in ALLOWED_TABLES, f"Invalid table: {table_name}"
+    if not db_url or not records:
+        return [None] * len(records)
+
+    conn = cur = None
+    try:
+        import psycopg2
+        from psycopg2.extras import execute_values
+        conn = psycopg2.connect(db_url.strip())
+        cur = conn.cursor()
+        rows = execute_values(cur, f"""
+            INSERT INTO {table_name}
+            (symbol, entry_time, entry_price, shares, signal_score, signal_rsi, signal_notional)
+            VALUES %s
+            RETURNING id, symbol
+        """, records, page_size=len(records), fetch=True)
+        conn.commit()
+        ids_by_symbol = {symbol: trade_id for trade_id, symbol in rows}
+        trade_ids = [ids_by_symbol.get(record[0]) for record in records]
+        logger.info(f"Logged {len(rows)} trade opens to {table_name}")
+        return trade_ids
+    except Exception as e:
+        logger.warning(f"Failed to bulk log trade opens to DB: {e}")
+        return [None] * len(records)
+    finally:
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            conn.close()
+
+
+def log_trades_close_bulk(db_url: str, closes: list, table_name: str = "paper_trades_log"):
+    """
+    Close several trades by id on one connection and commit.
+
+    closes: (exit_time, exit_price, pnl, pnl_pct, exit_reason, trade_db_id) tuples.
+    """
+    assert table_name in ALLOWED_TABLES, f"Invalid table: {table_name}"
+    if not db_url or not closes:
+        return
+
+    conn = cur = None
+    try:
+        import psycopg2
+        from psycopg2.extras import execute_batch
+        conn = psycopg2.connect(db_url.strip())
+        cur = conn.cursor()
+        execute_batch(cur, f"""
+            UPDATE {table_name}
+            SET exit_time = %s, exit_price = %s, pnl = %s, pnl_pct = %s, exit_reason = %s
+            WHERE id = %s
+        """, closes, page_size=100)
+        conn.commit()
+        logger.info(f"Logged {len(closes)} trade closes to {table_name}")
+    except Exception as e:
+        logger.warning(f"Failed to bulk log trade closes to DB: {e}")
+    finally:
+        if cur is not None:
+            cur.close()
+        if conn is not None:
+            conn.close()
+
+
 def load_open_trades_from_db(db_url: str, table_name: str = "paper_trades_log") -> list:
     """
     Load open trades from paper_trades_log (or paper_trades_log_b) for startup recovery.
@@ -7,18 +7,23 @@ v58+: When momentum screener is active, only closes prior-day positions (D+1 exi
 """
 
 import asyncio
+import functools
 import logging
-from datetime import datetime, time as dt_time
+import time
+from datetime import datetime, time as dt_time, timedelta, timezone
 from typing import Callable, List, Optional
 
-import pytz
-
 from .config import TradingConfig, DEFAULT_CONFIG
 from .position_manager import PositionManager
 
 logger = logging.getLogger(__name__)
 
-ET = pytz.timezone("America/New_York")
+
+@functools.cache
+def _et():
+    """America/New_York tzinfo, loaded on first use rather than at import."""
+    from zoneinfo import ZoneInfo
+    return ZoneInfo("America/New_York")
 
 
 class EODCloser:
@@ -50,13 +55,19 @@ class EODCloser:
         self._closed_today = False
         self._task: Optional[asyncio.Task] = None
 
+        # Today's EXIT_TIME and next ET midnight as epoch seconds, so
+        # should_close is a float compare (recomputed once per day)
+        self._exit_epoch = 0.0
+        self._day_end_epoch = 0.0
+        self._is_weekend = False
+
     def _get_et_time(self) -> dt_time:
         """Get current time in ET."""
-        return datetime.now(ET).time()
+        return datetime.now(_et()).time()
 
     def _get_et_datetime(self) -> datetime:
         """Get current datetime in ET."""
-        return datetime.now(ET)
+        return datetime.now(_et())
 
     def is_market_hours(self) -> bool:
         """Check if market is currently open."""
@@ -68,20 +79,30 @@ class EODCloser:
         if self._closed_today:
             return False
 
-        now_dt = self._get_et_datetime()
+        now_ts = time.time()
+        if now_ts >= self._day_end_epoch:
+            self._refresh_day_epochs()
 
         # Must be a weekday (Mon-Fri). Cloud Run can restart on weekends
         # and fire this check — sells get queued and fill Monday open.
-        if now_dt.weekday() >= 5:
+        if self._is_weekend:
             return False
 
-        now = now_dt.time()
-
         # Close at or after exit time (3:55 PM ET through end of day).
         # Previously required now < MARKET_CLOSE, but that missed the
         # window if the service started after 4 PM ET, leaving orphaned
         # positions on Alpaca overnight.
-        return now >= self.config.EXIT_TIME
+        return now_ts >= self._exit_epoch
+
+    def _refresh_day_epochs(self):
+        """Recompute today's exit and end-of-day epochs (ET)."""
+        et = _et()
+        today = datetime.now(et).date()
+        self._is_weekend = today.weekday() >= 5
+        self._exit_epoch = datetime.combine(today, self.config.EXIT_TIME, tzinfo=et).timestamp()
+        self._day_end_epoch = datetime.combine(
+            today + timedelta(days=1), dt_time(0, 0), tzinfo=et
+        ).timestamp()
 
     def reset_daily(self):
         """Reset for new trading day."""
@@ -116,7 +137,7 @@ class EODCloser:
         Note: entry_time is naive (UTC on Cloud Run). We localize to ET
         before comparing dates to handle the UTC/ET day boundary correctly.
         """
-        today = datetime.now(ET).date()
+        today = datetime.now(_et()).date()
         positions = self.position_manager.active_trades
 
         def _entry_date_et(t):
@@ -125,8 +146,8 @@ class EODCloser:
                 return today  # treat missing as same-day (don't close)
             if t.entry_time.tzinfo is None:
                 # Naive datetime from Cloud Run (UTC) — localize then convert
-                return t.entry_time.replace(tzinfo=pytz.utc).astimezone(ET).date()
-            return t.entry_time.astimezone(ET).date()
+                return t.entry_time.replace(tzinfo=timezone.utc).astimezone(_et()).date()
+            return t.entry_time.astimezone(_et()).date()
 
         prior_day = [
             t for t in positions.values()
@@ -230,21 +251,42 @@ class EODCloser:
         await self.close_positions()
 
 
+# Per-second memo for time_until_close (callers like health checks poll it freely)
+_last_ts: Optional[int] = None
+_last_config: Optional[TradingConfig] = None
+_last_secs: Optional[float] = None
+
+
 def time_until_close(config: TradingConfig = DEFAULT_CONFIG) -> Optional[float]:
     """
     Get seconds until exit time.
 
     Returns None if market is closed or past exit time.
+    Result is memoized for the current monotonic second.
     """
-    now = datetime.now(ET)
+    global _last_ts, _last_config, _last_secs
+
+    ts = int(time.monotonic())
+    if ts == _last_ts and config is _last_config:
+        return _last_secs
+
+    _last_secs = _compute_time_until_close(config)
+    _last_ts, _last_config = ts, config
+    return _last_secs
+
+
+def _compute_time_until_close(config: TradingConfig) -> Optional[float]:
+    """Uncached body of time_until_close."""
+    et = _et()
+    now = datetime.now(et)
     today = now.date()
 
     # Check if weekend
     if now.weekday() >= 5:
         return None
 
-    exit_dt = ET.localize(datetime.combine(today, config.EXIT_TIME))
-    market_close_dt = ET.localize(datetime.combine(today, config.MARKET_CLOSE))
+    exit_dt = datetime.combine(today, config.EXIT_TIME, tzinfo=et)
+    market_close_dt = datetime.combine(today, config.MARKET_CLOSE, tzinfo=et)
 
     if now >= market_close_dt:
         return None  # Market closed
@@ -264,7 +306,7 @@ if __name__ == "__main__":
     print(f"Exit time: {config.EXIT_TIME}")
     print(f"Market close: {config.MARKET_CLOSE}")
 
-    now_et = datetime.now(ET)
+    now_et = datetime.now(_et())
     print(f"Current time (ET): {now_et.strftime('%H:%M:%S')}")
 
     secs = time_until_close(config)
@@ -15,27 +15,39 @@ Usage:
 
 import argparse
 import asyncio
-import json
+import atexit
 import logging
 import os
+import queue
 import re
 import sys
-import threading
-from datetime import datetime, date, time as dt_time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import time
+from contextlib import aclosing
+from datetime import datetime, date, time as dt_time, timedelta
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional, Dict
+from zoneinfo import ZoneInfo
 
-import pytz
+import orjson
+from aiohttp import web
+
+try:
+    import uvloop  # libuv event loop (Linux/macOS); stock asyncio loop elsewhere
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from paper_trading import _ta_kernels
 from paper_trading.config import TradingConfig, DEFAULT_CONFIG
 from paper_trading.alpaca_trader import AlpacaTrader
 from paper_trading.position_manager import PositionManager
-from paper_trading.signal_filter import SignalFilter, Signal, SignalGenerator
-from paper_trading.eod_closer import EODCloser, time_until_close
+from paper_trading.signal_filter import SignalFilter, SignalGenerator
+from paper_trading.eod_closer import EODCloser
 from paper_trading.trade_aggregator import TradeAggregator
 from paper_trading.dashboard import get_dashboard, Dashboard
 from paper_trading.engulfing_checker import PatternPoller
@@ -43,24 +55,56 @@ from paper_trading.rsi_screener import MomentumScreener
 from paper_trading.cameron_checker import CameronChecker
 from paper_trading.cameron_scanner import CameronScanner
 
-from firehose.client import FirehoseClient, Trade
+from firehose.client import FirehoseClient
 from firehose.stock_price_monitor import StockPriceMonitor
 from firehose.bucket_aggregator import BucketAggregator
 from firehose.aggregator import RollingAggregator
 from firehose.hot_options_detector import HotOptionsDetector
 from paper_trading.bar_collector import IntradayBarCollector
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
+
+# OCC option symbol -> underlying (matched on every firehose trade)
+_OPTION_RE = re.compile(r"O:([A-Z]+)\d{6}[CP]\d{8}")
 
-# Logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("paper_trading.log"),
-    ]
+# Constant query text so asyncpg's per-connection statement cache hits.
+# One array value instead of one Record per symbol.
+_TRACKED_SYMBOLS_SQL = (
+    "SELECT array_agg(symbol ORDER BY symbol) FROM tracked_tickers_v2 WHERE ta_enabled = TRUE"
 )
+
+
+def _load_json_file(path: Path):
+    """Read and parse a JSON file (run via asyncio.to_thread)."""
+    return orjson.loads(path.read_bytes())
+
+
+async def _init_db_connection(conn):
+    """
+    asyncpg pool init hook, run once per new connection.
+
+    Creates the session-local staging table used for binary COPY upserts,
+    so the write path doesn't re-issue DDL on every batch.
+    """
+    await conn.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS tracked_tickers_v2_stage
+        (symbol TEXT, ts TIMESTAMPTZ) ON COMMIT DELETE ROWS
+    """)
+
+
+# Logging setup — the stream/file handlers run on a QueueListener thread,
+# so log calls on the event loop only enqueue the record
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handlers = [
+    logging.StreamHandler(),
+    logging.FileHandler("paper_trading.log"),
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush queued records on exit
 logger = logging.getLogger(__name__)
 
 
@@ -197,8 +241,23 @@ class PaperTradingEngine:
 
         # State
         self._running = False
+        self._periodic_tasks: list = []  # Interval jobs started in run()
+        self._trade_q: asyncio.Queue = asyncio.Queue(maxsize=config.TRADE_QUEUE_MAX)
+        self._trade_workers: list = []
+        self._trades_dropped = 0  # Firehose trades dropped because _trade_q was full
+        self._et_now_sec = -1  # Second of the cached value in _get_et_now_coarse
+        self._et_now_cached: Optional[datetime] = None
+        # 1s caches for _is_trading_hours / _is_entry_allowed (monotonic expiry)
+        self._hours_cached = False
+        self._hours_cached_until = 0.0
+        self._entry_cached = False
+        self._entry_cached_until = 0.0
+        # Today's ET session boundaries as epoch seconds (see _refresh_session_bounds)
+        self._day_start_ts = self._day_end_ts = 0.0
+        self._open_ts = self._close_ts = self._last_entry_ts = 0.0
         self._graceful_shutdown = False
         self._last_daily_reset: Optional[date] = None
+        self._next_reset_mono = 0.0  # monotonic deadline of the next possible day change
         self._eod_complete = False  # Flag to stop signal processing after EOD close
 
         # TA cache (loaded at startup)
@@ -206,15 +265,31 @@ class PaperTradingEngine:
 
         # Real-time price cache from WebSocket
         self._realtime_prices: Dict[str, float] = {}
+        self._dirty_price_symbols: set = set()  # Updated since last trigger window
+        self._price_trigger_task: Optional[asyncio.Task] = None
 
         # BucketAggregator for baseline generation (initialized in run())
         self.bucket_aggregator = None
         self._db_pool = None
+        self._bucket_flush_tasks: set = set()  # In-flight _flush_bucket tasks (strong refs)
+        self._bucket_flush_lock = asyncio.Lock()  # One bucket flush at a time (shared retry list)
+
+        # Off-hot-path DB writes: (kind, payload) drained in batches by _sink_consumer
+        self._sink_q: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._sink_task: Optional[asyncio.Task] = None
 
         # Intraday bar collector (initialized in run())
         self.bar_collector: Optional[IntradayBarCollector] = None
         self._bar_retention_pending = False
 
+        # TA-enabled watchlist cache for bar collection. Refetched after
+        # TRACKED_SYMBOLS_CACHE_TTL_SEC, or immediately when the
+        # tracked_tickers_changed NOTIFY fires (sql/create_tracked_tickers_notify.sql)
+        self._symbols_cache: tuple = ()
+        self._symbols_cache_ts = 0.0
+        self._ticker_listener_task: Optional[asyncio.Task] = None
+        self._stmt_tickers = None  # Prepared on the listener's connection
+
         # WebSocket health tracking (PROD-1 graceful degradation)
         self._websocket_healthy = False
         self._websocket_enabled = config.USE_STOCK_WEBSOCKET
@@ -234,10 +309,65 @@ class PaperTradingEngine:
         """Get current time in ET."""
         return datetime.now(ET)
 
-    def _is_trading_hours(self) -> bool:
-        """Check if within trading hours."""
-        now = self._get_et_now().time()
-        return self.config.MARKET_OPEN <= now <= self.config.MARKET_CLOSE
+    def _get_et_now_coarse(self) -> datetime:
+        """
+        Get current time in ET, reused for all calls within the same second.
+
+        For per-trade/per-tick checks that only need the time of day or date.
+        """
+        sec = int(time.time())
+        if sec != self._et_now_sec:
+            self._et_now_sec = sec
+            self._et_now_cached = datetime.now(ET)
+        return self._et_now_cached
+
+    def _seconds_until_open(self, now_et: Optional[datetime] = None) -> float:
+        """Seconds until the next weekday MARKET_OPEN, or 0 during trading hours."""
+        now_et = now_et or self._get_et_now_coarse()
+        if now_et.weekday() < 5 and self._is_trading_hours(now_et):
+            return 0.0
+        open_day = now_et.date()
+        if now_et.time() > self.config.MARKET_OPEN:
+            open_day += timedelta(days=1)  # After the close: tomorrow's open
+        while open_day.weekday() >= 5:
+            open_day += timedelta(days=1)  # Weekend: Monday's open
+        open_dt = datetime.combine(open_day, self.config.MARKET_OPEN, tzinfo=ET)
+        return (open_dt - now_et).total_seconds()
+
+    def _is_trading_hours(self, now_et: Optional[datetime] = None) -> bool:
+        """Check if within trading hours (cached for 1s unless now_et is given)."""
+        if now_et is not None:
+            now = now_et.time()
+            return self.config.MARKET_OPEN <= now <= self.config.MARKET_CLOSE
+        now_m = time.monotonic()
+        if now_m >= self._hours_cached_until:
+            t = time.time()
+            if not self._day_start_ts <= t < self._day_end_ts:
+                self._refresh_session_bounds()
+            self._hours_cached = self._open_ts <= t <= self._close_ts
+            self._hours_cached_until = now_m + 1.0
+        return self._hours_cached
+
+    async def _disconnect_firehose_at_close(self):
+        """
+        Disconnect the firehose once trading hours end.
+
+        Timer-driven: the options feed goes quiet after the close, so a check
+        on trade arrival could leave the socket connected overnight.
+        """
+        self._is_trading_hours()  # Refresh today's session bounds
+        while self._is_trading_hours():
+            await asyncio.sleep(max(1.0, self._close_ts - time.time()))
+        await self.firehose.disconnect()
+
+    def _refresh_session_bounds(self):
+        """Precompute today's ET session boundaries as epoch seconds."""
+        day = datetime.now(ET).date()
+        self._day_start_ts = datetime.combine(day, dt_time.min, tzinfo=ET).timestamp()
+        self._day_end_ts = datetime.combine(day + timedelta(days=1), dt_time.min, tzinfo=ET).timestamp()
+        self._open_ts = datetime.combine(day, self.config.MARKET_OPEN, tzinfo=ET).timestamp()
+        self._close_ts = datetime.combine(day, self.config.MARKET_CLOSE, tzinfo=ET).timestamp()
+        self._last_entry_ts = datetime.combine(day, self.config.LAST_ENTRY_TIME, tzinfo=ET).timestamp()
 
     def _on_stock_price_update(self, symbol: str, price: float, timestamp: datetime):
         """
@@ -246,17 +376,44 @@ class PaperTradingEngine:
         Used for:
         - Hard stop monitoring (faster than REST polling)
         - Entry price validation
+
+        Only records the price; stop/target evaluation is coalesced into
+        PRICE_TRIGGER_WINDOW_SEC windows by _price_trigger_loop.
         """
         self._realtime_prices[symbol] = price
+        self._dirty_price_symbols.add(symbol)
 
-        # Only act on prices during trading hours — Cloud Run can restart
-        # on weekends/overnight and replay stale WebSocket data.
-        if not self._is_trading_hours():
-            return
+    async def _price_trigger_loop(self):
+        """
+        Evaluate stops/targets for symbols whose price changed in the last window.
+
+        A burst of ticks for one symbol costs one evaluation per window
+        instead of one per tick.
+        """
+        window = self.config.PRICE_TRIGGER_WINDOW_SEC
+        while True:
+            await asyncio.sleep(window)
+            if not self._dirty_price_symbols:
+                continue
+
+            dirty, self._dirty_price_symbols = self._dirty_price_symbols, set()
 
+            # Only act on prices during trading hours — Cloud Run can restart
+            # on weekends/overnight and replay stale WebSocket data.
+            if not self._is_trading_hours():
+                continue
+
+            for symbol in dirty:
+                try:
+                    self._check_price_triggers(symbol, self._realtime_prices[symbol])
+                except Exception as e:
+                    logger.error(f"Price trigger check failed for {symbol}: {e}")
+
+    def _check_price_triggers(self, symbol: str, price: float):
+        """Check hard stop (A) and stop/target (B, C) for one symbol at a new price."""
         # Check hard stop if we have a position in this symbol (Account A)
-        if symbol in self.position_manager.active_trades and self.config.USE_HARD_STOP:
-            trade = self.position_manager.active_trades[symbol]
+        trade = self.position_manager.active_trades.get(symbol)
+        if trade is not None and self.config.USE_HARD_STOP:
             pnl_pct = (price - trade.entry_price) / trade.entry_price
 
             if pnl_pct <= self.config.HARD_STOP_PCT and symbol not in self._closing_symbols:
@@ -268,9 +425,9 @@ class PaperTradingEngine:
                 asyncio.create_task(self._async_hard_stop(symbol))
 
         # Check stop/target for Account B (direction-aware)
-        if (self._account_b_enabled
-                and symbol in self.position_manager_b.active_trades):
-            trade_b = self.position_manager_b.active_trades[symbol]
+        trade_b = (self.position_manager_b.active_trades.get(symbol)
+                   if self._account_b_enabled else None)
+        if trade_b is not None:
             if symbol not in self._closing_symbols_b:
                 should_close = False
                 reason = ""
@@ -299,9 +456,9 @@ class PaperTradingEngine:
                     asyncio.create_task(self._async_exit_b(symbol, reason))
 
         # Check stop/target for Account C (bullish only — Cameron is long-only)
-        if (self._account_c_enabled
-                and symbol in self.position_manager_c.active_trades):
-            trade_c = self.position_manager_c.active_trades[symbol]
+        trade_c = (self.position_manager_c.active_trades.get(symbol)
+                   if self._account_c_enabled else None)
+        if trade_c is not None:
             if symbol not in self._closing_symbols_c:
                 should_close = False
                 reason = ""
@@ -633,30 +790,39 @@ class PaperTradingEngine:
         if not self._websocket_enabled:
             return
 
-        # Subscribe to all symbols with active positions (both accounts)
-        position_symbols = list(self.position_manager.active_trades.keys())
-        pending_symbols = list(self.position_manager._pending_buys)
+        # Subscribe to all symbols with active positions and pending orders (all accounts)
+        desired = set(self.position_manager.active_trades)
+        desired.update(self.position_manager._pending_buys)
 
         # Include Account B positions and pending limit orders
         if self._account_b_enabled:
-            position_symbols += list(self.position_manager_b.active_trades.keys())
-            pending_symbols += list(self.position_manager_b._pending_limit_orders.keys())
+            desired.update(self.position_manager_b.active_trades)
+            desired.update(self.position_manager_b._pending_limit_orders)
 
         # Include Account C positions and pending limit orders
         if self._account_c_enabled:
-            position_symbols += list(self.position_manager_c.active_trades.keys())
-            pending_symbols += list(self.position_manager_c._pending_limit_orders.keys())
+            desired.update(self.position_manager_c.active_trades)
+            desired.update(self.position_manager_c._pending_limit_orders)
 
-        all_symbols = list(set(position_symbols + pending_symbols))
+        if not desired or not self.stock_monitor.is_connected:
+            return
 
-        if all_symbols and self.stock_monitor.is_connected:
-            await self.stock_monitor.set_symbols(all_symbols)
-            logger.debug(f"Stock subscriptions updated: {all_symbols}")
+        # Only touch the WebSocket when the subscription set actually changed;
+        # set_symbols then sends just the added/removed delta
+        if desired == self.stock_monitor.subscribed_symbols:
+            return
+
+        await self.stock_monitor.set_symbols(list(desired))
+        logger.debug(f"Stock subscriptions updated: {sorted(desired)}")
 
-    def _check_daily_reset(self):
+    def _check_daily_reset(self, now_et: Optional[datetime] = None):
         """Reset daily state if new trading day."""
-        today = self._get_et_now().date()
-        now_time = self._get_et_now().time()
+        # The date can't change before the next ET midnight
+        if time.monotonic() < self._next_reset_mono:
+            return
+        now_et = now_et or self._get_et_now_coarse()
+        today = now_et.date()
+        now_time = now_et.time()
 
         if self._last_daily_reset != today:
             logger.info(f"New trading day: {today}")
@@ -702,6 +868,11 @@ class PaperTradingEngine:
             else:
                 logger.info("Mid-day restart: preserving dashboard data")
 
+        # Re-arm for the next ET midnight (after the reset, so a failed
+        # reset is retried on the next call)
+        next_midnight = datetime.combine(today + timedelta(days=1), dt_time(0), tzinfo=ET)
+        self._next_reset_mono = time.monotonic() + (next_midnight - now_et).total_seconds()
+
     async def load_ta_cache(self):
         """
         Load prior-day TA data from database (preferred) or JSON file (fallback).
@@ -711,25 +882,21 @@ class PaperTradingEngine:
         2. Local JSON file - only works if premarket job ran in same container
 
         The premarket-ta-cache job writes to both database and JSON.
+        Uses the asyncpg pool so the query doesn't block the event loop.
         """
         # Try database first (works across containers)
-        database_url = os.environ.get("DATABASE_URL")
-        if database_url:
+        if self._db_pool:
             try:
-                import psycopg2
-                conn = psycopg2.connect(database_url.strip())
-                cur = conn.cursor()
-
                 # Get most recent TA data for each symbol
-                cur.execute("""
-                    SELECT symbol, rsi_14, macd_histogram, sma_20, sma_50, close_price,
-                           CASE WHEN close_price > sma_20 THEN 1 ELSE -1 END as trend
-                    FROM ta_daily_close
-                    WHERE trade_date = (SELECT MAX(trade_date) FROM ta_daily_close)
-                """)
-
-                for row in cur.fetchall():
-                    symbol, rsi_14, macd_hist, sma_20, sma_50, last_close, trend = row
+                async with self._db_pool.acquire() as conn:
+                    rows = await conn.fetch("""
+                        SELECT symbol, rsi_14, macd_histogram, sma_20, sma_50, close_price,
+                               CASE WHEN close_price > sma_20 THEN 1 ELSE -1 END as trend
+                        FROM ta_daily_close
+                        WHERE trade_date = (SELECT MAX(trade_date) FROM ta_daily_close)
+                    """)
+
+                for symbol, rsi_14, macd_hist, sma_20, sma_50, last_close, trend in rows:
                     self._ta_cache[symbol] = {
                         "rsi_14": float(rsi_14) if rsi_14 else None,
                         "macd_hist": float(macd_hist) if macd_hist else None,
@@ -739,9 +906,6 @@ class PaperTradingEngine:
                         "trend": trend,
                     }
 
-                cur.close()
-                conn.close()
-
                 if self._ta_cache:
                     logger.info(f"Loaded TA cache from database: {len(self._ta_cache)} symbols")
                     self.signal_generator.load_ta_cache(self._ta_cache)
@@ -755,10 +919,10 @@ class PaperTradingEngine:
 
         if ta_file.exists():
             try:
-                with open(ta_file) as f:
-                    data = json.load(f)
-                    self._ta_cache = data.get("ta_data", {})
-                    logger.info(f"Loaded TA cache from file: {len(self._ta_cache)} symbols")
+                # Read + parse in a thread; the file can be several MB
+                data = await asyncio.to_thread(_load_json_file, ta_file)
+                self._ta_cache = data.get("ta_data", {})
+                logger.info(f"Loaded TA cache from file: {len(self._ta_cache)} symbols")
             except Exception as e:
                 logger.error(f"Failed to load TA cache from file: {e}")
         else:
@@ -768,44 +932,43 @@ class PaperTradingEngine:
 
     async def load_baselines(self):
         """
-        Load per-symbol baselines from intraday_baselines_30m table.
+        Load per-symbol baselines from the baselines_20d materialized view.
 
-        Calculates average notional per symbol from recent trading days.
-        Falls back to $50K default if query fails or no data.
+        The view holds the 20-day average notional per symbol, precomputed
+        from intraday_baselines_30m by the nightly refresh job. Falls back to
+        aggregating intraday_baselines_30m directly if the view is missing,
+        and to the $50K default if both fail or return no data.
         """
-        database_url = os.environ.get("DATABASE_URL")
-        if not database_url:
-            logger.warning("DATABASE_URL not set, using default $50K baselines")
+        if not self._db_pool:
+            logger.warning("No database pool, using default $50K baselines")
             return
 
         try:
-            import psycopg2
-            conn = psycopg2.connect(database_url.strip())
-            cur = conn.cursor()
-
-            # Get average notional per symbol from last 20 trading days
-            cur.execute("""
-                SELECT
-                    symbol,
-                    AVG(notional) as avg_notional
-                FROM intraday_baselines_30m
-                WHERE trade_date > CURRENT_DATE - 20
-                  AND bucket_start BETWEEN '09:30' AND '16:00'
-                GROUP BY symbol
-                HAVING AVG(notional) > 0
-            """)
-
-            baselines = {}
-            for row in cur.fetchall():
-                symbol, avg_notional = row
-                baselines[symbol] = float(avg_notional)
-
-            cur.close()
-            conn.close()
+            import asyncpg
+            async with self._db_pool.acquire() as conn:
+                # Precomputed 20-day averages (sql/create_baselines_20d.sql)
+                source = "baselines_20d"
+                try:
+                    rows = await conn.fetch("SELECT symbol, avg_notional FROM baselines_20d")
+                except asyncpg.UndefinedTableError as e:
+                    logger.warning(f"baselines_20d unavailable ({e}), aggregating intraday_baselines_30m")
+                    source = "intraday_baselines_30m"
+                    rows = await conn.fetch("""
+                        SELECT
+                            symbol,
+                            AVG(notional) as avg_notional
+                        FROM intraday_baselines_30m
+                        WHERE trade_date > CURRENT_DATE - 20
+                          AND bucket_start BETWEEN '09:30' AND '16:00'
+                        GROUP BY symbol
+                        HAVING AVG(notional) > 0
+                    """)
+
+            baselines = {symbol: float(avg_notional) for symbol, avg_notional in rows}
 
             if baselines:
                 self.aggregator.load_baselines(baselines)
-                logger.info(f"Loaded baselines: {len(baselines)} symbols from intraday_baselines_30m")
+                logger.info(f"Loaded baselines: {len(baselines)} symbols from {source}")
                 # Log some stats
                 avg_baseline = sum(baselines.values()) / len(baselines)
                 logger.info(f"  Average baseline: ${avg_baseline:,.0f}")
@@ -817,39 +980,75 @@ class PaperTradingEngine:
             logger.warning(f"Failed to load baselines from database: {e}")
             logger.warning("Using default $50K baselines")
 
-    async def _process_trade(self, trade: Trade):
-        """Process a single trade from firehose."""
+    def _process_trades(self, trades: list):
+        """Process a batch of trades from firehose (no awaits on this path)."""
         # Add to aggregator
-        self.aggregator.add_trade(trade)
+        self.aggregator.add_trades(trades)
 
         # Feed bucket aggregator for baseline generation
-        if self.bucket_aggregator:
-            match = re.match(r"O:([A-Z]+)\d{6}[CP]\d{8}", trade.symbol)
-            if match:
-                underlying = match.group(1)
-
-                # Also feed 5-min rolling aggregator for hot options
-                self.rolling_agg_5m.add_trade_fast(
-                    underlying=underlying,
-                    option_symbol=trade.symbol,
-                    price=trade.price,
-                    size=trade.size,
-                )
-                boundary_crossed = self.bucket_aggregator.add_trade(
-                    underlying=underlying,
-                    option_symbol=trade.symbol,
-                    price=trade.price,
-                    size=trade.size,
-                )
-                if boundary_crossed:
-                    try:
-                        rows = await self.bucket_aggregator.flush()
-                        logger.info(f"Bucket boundary: flushed {rows} baseline rows to DB")
-                        # Compute intraday flow signals after flush
-                        if rows:
-                            await self._compute_intraday_flow_signals()
-                    except Exception as e:
-                        logger.warning(f"Bucket flush failed: {e}")
+        bucket_aggregator = self.bucket_aggregator
+        if not bucket_aggregator:
+            return
+        add_trade_5m = self.rolling_agg_5m.add_trade_fast
+        match_option = _OPTION_RE.match
+        for trade in trades:
+            match = match_option(trade.symbol)
+            if not match:
+                continue
+            underlying = match.group(1)
+
+            # Also feed 5-min rolling aggregator for hot options
+            add_trade_5m(
+                underlying=underlying,
+                option_symbol=trade.symbol,
+                price=trade.price,
+                size=trade.size,
+            )
+            boundary_crossed = bucket_aggregator.add_trade(
+                underlying=underlying,
+                option_symbol=trade.symbol,
+                price=trade.price,
+                size=trade.size,
+            )
+            if boundary_crossed:
+                # Detach now so later trades start the new bucket; the
+                # DB write runs off the trade path
+                task = asyncio.create_task(
+                    self._flush_bucket(bucket_aggregator.take_bucket()))
+                self._bucket_flush_tasks.add(task)
+                task.add_done_callback(self._bucket_flush_tasks.discard)
+
+    async def _flush_bucket(self, buckets: list):
+        """Flush the finished 30-min bucket, then compute intraday flow signals."""
+        try:
+            async with self._bucket_flush_lock:
+                rows = await self.bucket_aggregator.flush(buckets)
+            logger.info(f"Bucket boundary: flushed {rows} baseline rows to DB")
+            # Compute intraday flow signals after flush
+            if rows:
+                await self._compute_intraday_flow_signals()
+        except Exception as e:
+            logger.warning(f"Bucket flush failed: {e}")
+
+    async def _trade_worker(self):
+        """Process queued firehose trades so slow paths don't stall the stream read."""
+        q = self._trade_q
+        batch_max = self.config.TRADE_BATCH_MAX
+        while True:
+            # Wait for one trade, then take whatever else is already queued
+            batch = [await q.get()]
+            while len(batch) < batch_max:
+                try:
+                    batch.append(q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                self._process_trades(batch)
+            except Exception as e:
+                logger.error(f"Trade processing failed for batch of {len(batch)}: {e}")
+            finally:
+                for _ in batch:
+                    q.task_done()  # Lets shutdown() join the queue
 
     async def _compute_intraday_flow_signals(self) -> None:
         """Compute flow_signals from today's call/put volumes + latest ORATS."""
@@ -911,10 +1110,158 @@ class PaperTradingEngine:
         except Exception as e:
             logger.error(f"Intraday flow_signals failed: {e}")
 
-    def _is_entry_allowed(self) -> bool:
-        """Check if we're within the time window to open new positions."""
-        now = self._get_et_now().time()
-        return self.config.MARKET_OPEN <= now <= self.config.LAST_ENTRY_TIME
+    async def _sink_consumer(self):
+        """
+        Drain _sink_q and write queued side effects in batches.
+
+        Collects up to 50 items or 100ms worth, whichever comes first,
+        then issues one write per kind.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._sink_q.get()]
+            deadline = loop.time() + 0.1
+            while len(batch) < 50:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._sink_q.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush_sink(batch)
+
+    def _drain_sink_queue(self) -> list:
+        """Pop everything currently queued (used at shutdown)."""
+        batch = []
+        while not self._sink_q.empty():
+            batch.append(self._sink_q.get_nowait())
+        return batch
+
+    async def _flush_sink(self, batch: list):
+        """Write a batch of queued side effects, grouped by kind."""
+        tracked = [payload for kind, payload in batch if kind == "tracked_ticker"]
+        if tracked and self._db_pool:
+            try:
+                await self._write_tracked_tickers(tracked)
+            except Exception as e:
+                logger.warning(f"Failed to track triggered symbols: {e}")
+
+    async def _write_tracked_tickers(self, records: list):
+        """
+        Upsert (symbol, trigger_ts) records into tracked_tickers_v2.
+
+        Binary-COPYs into the per-connection staging table created by
+        _init_db_connection, then one set-based upsert (single round trip
+        instead of one per symbol).
+        """
+        async with self._db_pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.copy_records_to_table(
+                    "tracked_tickers_v2_stage",
+                    records=records,
+                    columns=("symbol", "ts"),
+                )
+                # A batch can span several signal checks, so collapse
+                # duplicate symbols before the upsert
+                await conn.execute("""
+                    INSERT INTO tracked_tickers_v2
+                    (symbol, first_trigger_ts, trigger_count, last_trigger_ts, ta_enabled)
+                    SELECT symbol, MIN(ts), COUNT(*), MAX(ts), TRUE
+                    FROM tracked_tickers_v2_stage
+                    GROUP BY symbol
+                    ON CONFLICT (symbol) DO UPDATE SET
+                        trigger_count = tracked_tickers_v2.trigger_count + EXCLUDED.trigger_count,
+                        last_trigger_ts = EXCLUDED.last_trigger_ts
+                """)
+
+    async def _get_tracked_symbols(self) -> tuple:
+        """
+        TA-enabled symbols from tracked_tickers_v2, cached in-process.
+
+        The watchlist changes rarely, so the query only runs when the TTL
+        lapses or _listen_ticker_changes has invalidated the cache.
+        """
+        now = time.monotonic()
+        if now - self._symbols_cache_ts < self.config.TRACKED_SYMBOLS_CACHE_TTL_SEC:
+            return self._symbols_cache
+
+        symbols = None
+        fetched = False
+        if self._stmt_tickers is not None:
+            try:
+                symbols = await self._stmt_tickers.fetchval()
+                fetched = True
+            except Exception as e:
+                logger.warning(f"Prepared tracked-tickers fetch failed, using pool: {e}")
+                self._stmt_tickers = None  # Listener connection is gone; it re-prepares on reconnect
+        if not fetched:
+            async with self._db_pool.acquire() as conn:
+                symbols = await conn.fetchval(_TRACKED_SYMBOLS_SQL)
+        # array_agg over no rows is NULL
+        self._symbols_cache = tuple(symbols or ())
+        self._symbols_cache_ts = now
+        return self._symbols_cache
+
+    def _on_tracked_tickers_changed(self, connection, pid, channel, payload):
+        """NOTIFY callback: force the next _get_tracked_symbols to refetch."""
+        self._symbols_cache_ts = 0.0
+
+    async def _listen_ticker_changes(self, db_url: str):
+        """
+        Hold a dedicated connection LISTENing on tracked_tickers_changed.
+
+        Pooled connections are reset on release (UNLISTEN *), so the
+        listener needs its own. The watchlist query is prepared once on this
+        otherwise idle connection and reused by _get_tracked_symbols. If the
+        connection drops, the statement is cleared at once and the listener
+        reconnects with backoff; the TTL bounds staleness in the meantime.
+        """
+        import asyncpg
+        delay = 1.0
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(db_url)
+                dropped = asyncio.get_running_loop().create_future()
+
+                def _on_terminate(_conn, dropped=dropped):
+                    self._stmt_tickers = None
+                    if not dropped.done():
+                        dropped.set_result(None)
+
+                conn.add_termination_listener(_on_terminate)
+                await conn.add_listener("tracked_tickers_changed", self._on_tracked_tickers_changed)
+                self._stmt_tickers = await conn.prepare(_TRACKED_SYMBOLS_SQL)
+                self._symbols_cache_ts = 0.0  # Notifications may have been missed while down
+                logger.info("Listening for tracked_tickers_changed notifications")
+                delay = 1.0
+                await dropped  # Until the connection terminates
+                logger.warning(f"tracked_tickers_changed listener connection lost, reconnecting in {delay:.0f}s")
+            except asyncio.CancelledError:
+                return
+            except Exception as e:
+                logger.warning(f"tracked_tickers_changed listener failed: {e} (retrying in {delay:.0f}s)")
+            finally:
+                self._stmt_tickers = None
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    def _is_entry_allowed(self, now_et: Optional[datetime] = None) -> bool:
+        """Check if we're within the time window to open new positions (cached for 1s)."""
+        if now_et is not None:
+            now = now_et.time()
+            return self.config.MARKET_OPEN <= now <= self.config.LAST_ENTRY_TIME
+        now_m = time.monotonic()
+        if now_m >= self._entry_cached_until:
+            t = time.time()
+            if not self._day_start_ts <= t < self._day_end_ts:
+                self._refresh_session_bounds()
+            self._entry_cached = self._open_ts <= t <= self._last_entry_ts
+            self._entry_cached_until = now_m + 1.0
+        return self._entry_cached
 
     async def _check_for_signals(self):
         """
@@ -931,40 +1278,38 @@ class PaperTradingEngine:
         # Get symbols with elevated activity
         triggered = self.aggregator.get_triggered_symbols()
 
-        # Track ALL triggered symbols for TA monitoring (not just passed)
-        if triggered and self._db_pool:
-            try:
-                now = self._get_et_now()
-                async with self._db_pool.acquire() as conn:
-                    await conn.executemany("""
-                        INSERT INTO tracked_tickers_v2
-                        (symbol, first_trigger_ts, trigger_count, last_trigger_ts, ta_enabled)
-                        VALUES ($1, $2, 1, $2, TRUE)
-                        ON CONFLICT (symbol) DO UPDATE SET
-                            trigger_count = tracked_tickers_v2.trigger_count + 1,
-                            last_trigger_ts = $2
-                    """, [(sym, now) for sym in triggered.keys()])
-            except Exception as e:
-                logger.warning(f"Failed to track triggered symbols: {e}")
+        # Track ALL triggered symbols for TA monitoring (not just passed).
+        # Queued for _sink_consumer so the signal loop never waits on the DB.
+        if triggered and self._sink_task:
+            now = self._get_et_now()
+            for sym in triggered:
+                try:
+                    self._sink_q.put_nowait(("tracked_ticker", (sym, now)))
+                except asyncio.QueueFull:
+                    logger.warning("Sink queue full, dropping tracked-ticker updates")
+                    break
 
         # Pre-subscribe to triggered symbols for real-time prices
         if triggered and self.stock_monitor.is_connected:
-            triggered_symbols = list(triggered.keys())[:10]  # Limit to 10 candidates
+            triggered_symbols = list(islice(triggered, 10))  # Limit to 10 candidates
             await self.stock_monitor.subscribe(triggered_symbols)
 
+        # ── Account A: full filter chain (disabled when momentum screener active) ──
+        # Account B now uses independent pattern polling, not UOA triggers
+        if not self.config.USE_UOA_SIGNALS:
+            return  # v58: Account A uses momentum screener, not UOA signals
+
+        # Symbols Account A can't enter (already_traded / has_position), snapshotted
+        # once. Triggered symbols are unique, so a position opened below never needs
+        # re-checking; capacity is still read live since each open consumes a slot.
+        pm = self.position_manager
+        a_blocked = pm.blocked_symbols()
+
         for symbol, stats in triggered.items():
-            # Account B now uses independent pattern polling, not UOA triggers
-            a_eligible = (self.position_manager.can_open_position
-                          and not self.position_manager.already_traded(symbol)
-                          and not self.position_manager.has_position(symbol))
-
-            # ── Account A: full filter chain (disabled when momentum screener active) ──
-            if not self.config.USE_UOA_SIGNALS:
-                continue  # v58: Account A uses momentum screener, not UOA signals
-            if not a_eligible:
-                if not self.position_manager.can_open_position:
-                    logger.info("Account A at max positions, skipping signal check")
-                    break
+            if not pm.can_open_position:
+                logger.info("Account A at max positions, skipping signal check")
+                break
+            if symbol in a_blocked:
                 continue
 
             # Create signal from aggregated stats (with dynamic TA fetch if needed)
@@ -998,7 +1343,7 @@ class PaperTradingEngine:
             self.position_manager.record_signal(result.passed)
 
             if result.passed:
-                logger.info(f"Signal passed filter: {symbol}")
+                logger.info("Signal passed filter: %s", symbol)
 
                 if not self.dry_run:
                     trade = await self.position_manager.open_position(
@@ -1010,11 +1355,11 @@ class PaperTradingEngine:
 
                     if trade:
                         logger.info(
-                            f"Position opened: {trade.symbol} "
-                            f"{trade.shares} shares @ ${trade.entry_price:.2f}"
+                            "Position opened: %s %s shares @ $%.2f",
+                            trade.symbol, trade.shares, trade.entry_price,
                         )
                 else:
-                    logger.info(f"[DRY RUN] Would open position: {symbol}")
+                    logger.info("[DRY RUN] Would open position: %s", symbol)
 
     async def _execute_momentum_buys(self):
         """
@@ -1096,15 +1441,16 @@ class PaperTradingEngine:
             return
 
         # Log which mode we're using (occasionally)
+        now = asyncio.get_running_loop().time()
         if not hasattr(self, '_last_mode_log') or \
-           (asyncio.get_event_loop().time() - self._last_mode_log) > 300:  # Every 5 min
+           (now - self._last_mode_log) > 300:  # Every 5 min
             mode = "WebSocket" if self.use_websocket_prices else "REST polling"
             logger.info(f"Price monitoring mode: {mode}")
-            self._last_mode_log = asyncio.get_event_loop().time()
+            self._last_mode_log = now
 
         stopped = await self.position_manager.check_hard_stops()
         for symbol in stopped:
-            logger.warning(f"Hard stop triggered (REST check): {symbol}")
+            logger.warning("Hard stop triggered (REST check): %s", symbol)
 
     async def _refresh_sparklines(self):
         """Refresh sparkline_1d table from today's spot_prices_1m bars."""
@@ -1138,7 +1484,7 @@ class PaperTradingEngine:
                     sampled = closes[::step]
 
                 upsert_data.append((
-                    symbol, today, json.dumps(sampled), len(closes)
+                    symbol, today, orjson.dumps(sampled).decode(), len(closes)
                 ))
 
             if upsert_data:
@@ -1200,46 +1546,56 @@ class PaperTradingEngine:
 
         # Log daily summary
         summary = self.position_manager.get_daily_summary()
-        logger.info(f"Daily Summary: {json.dumps(summary, indent=2)}")
+        logger.info(f"Daily Summary: {orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode()}")
 
-        # Save to file
-        self._save_daily_log(summary, closed_trades)
+        # Save to file (in a worker thread — keep file I/O off the event loop)
+        asyncio.ensure_future(self._save_daily_log_async(summary, closed_trades))
 
         # Sync engulfing dashboard order history (non-blocking, non-critical)
         if self.engulfing_trader:
             asyncio.ensure_future(self._sync_engulfing_orders())
 
+    async def _save_daily_log_async(self, summary: Dict, trades):
+        """Run _save_daily_log in a worker thread."""
+        try:
+            await asyncio.to_thread(self._save_daily_log, summary, trades)
+        except Exception as e:
+            logger.error(f"Failed to save daily log: {e}")
+
     def _save_daily_log(self, summary: Dict, trades):
-        """Save daily trading log to file."""
+        """
+        Save daily trading log to file as NDJSON.
+
+        First line is {"type": "summary", ...}; each following line is one
+        {"type": "trade", ...} record, written as it is serialized so memory
+        stays flat regardless of trade count.
+        """
         log_dir = Path(__file__).parent.parent / "paper_trading_logs"
         log_dir.mkdir(exist_ok=True)
 
         today = date.today().isoformat()
-        log_file = log_dir / f"{today}.json"
-
-        log_data = {
-            "date": today,
-            "summary": summary,
-            "trades": [
-                {
+        log_file = log_dir / f"{today}.ndjson"
+
+        # orjson serializes datetimes natively (ISO 8601, same as isoformat())
+        with open(log_file, "wb") as f:
+            f.write(orjson.dumps({"type": "summary", "date": today, "summary": summary}))
+            f.write(b"\n")
+            for t in trades:
+                f.write(orjson.dumps({
+                    "type": "trade",
                     "symbol": t.symbol,
-                    "entry_time": t.entry_time.isoformat() if t.entry_time else None,
+                    "entry_time": t.entry_time,
                     "entry_price": t.entry_price,
                     "shares": t.shares,
-                    "exit_time": t.exit_time.isoformat() if t.exit_time else None,
+                    "exit_time": t.exit_time,
                     "exit_price": t.exit_price,
                     "pnl": t.pnl,
                     "pnl_pct": t.pnl_pct,
                     "exit_reason": t.exit_reason,
                     "signal_score": t.signal_score,
                     "signal_rsi": t.signal_rsi,
-                }
-                for t in trades
-            ],
-        }
-
-        with open(log_file, "w") as f:
-            json.dump(log_data, f, indent=2)
+                }))
+                f.write(b"\n")
 
         logger.info(f"Daily log saved: {log_file}")
 
@@ -1254,6 +1610,150 @@ class PaperTradingEngine:
         except Exception as e:
             logger.warning(f"Engulfing order history sync failed: {e}")
 
+    async def _periodic(self, name: str, interval: float, fn):
+        """
+        Run fn every `interval` seconds while the engine is running.
+
+        Like the trade loop, jobs only run during trading hours and after
+        the daily reset for the current day. Runs are scheduled at a fixed
+        rate, so a slow job doesn't push every later run back by its runtime.
+        """
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+        while self._running:
+            now_et = self._get_et_now_coarse()
+            self._check_daily_reset(now_et)
+            if self._is_trading_hours(now_et):
+                # The one error handler for every periodic job
+                try:
+                    await fn()
+                except Exception as e:
+                    logger.warning(f"{name} failed: {e}")
+            next_run += interval
+            now = loop.time()
+            if next_run < now:
+                # Overran the interval: skip missed runs instead of bursting
+                next_run = now + interval
+            await asyncio.sleep(next_run - now)
+
+    async def _health_tick(self):
+        """Render the /health body once a second (not gated on trading hours)."""
+        global _health_body
+        while self._running:
+            pool = self._db_pool
+            _health_body = _HEALTH_TEMPLATE % (
+                _health_status["status"].encode(),
+                self.firehose.metrics.trades_received,
+                len(self.position_manager.active_trades),
+                self._trades_dropped,
+                datetime.now(ET).isoformat().encode(),
+                pool.get_size() if pool is not None else 0,
+                pool.get_idle_size() if pool is not None else 0,
+            )
+            await asyncio.sleep(1)
+
+    async def _run_signal_check(self):
+        """Signal check plus v58 momentum screen/buy timing."""
+        await self._check_for_signals()
+
+        # v58: Momentum screener time-based checks (inside signal interval)
+        if self._momentum_screener:
+            now_et = self._get_et_now()
+            now_time = now_et.time()
+
+            # Run momentum screen at 3:50 PM
+            if (not self._momentum_screened_today
+                    and now_time >= self.config.MOMENTUM_SCREEN_TIME):
+                try:
+                    self._momentum_candidates = await self._momentum_screener.screen()
+                    self._momentum_screened_today = True
+                    logger.info(f"Momentum screen complete: {len(self._momentum_candidates)} candidates")
+                except Exception as e:
+                    logger.error(f"Momentum screen failed: {e}")
+                    self._momentum_screened_today = True  # Don't retry
+
+            # Execute momentum buys at 3:56 PM (after EOD closer runs at 3:55)
+            if (self._momentum_candidates
+                    and not self._momentum_bought_today
+                    and now_time >= self.config.MOMENTUM_BUY_TIME):
+                await self._execute_momentum_buys()
+                self._momentum_bought_today = True
+
+    async def _run_stop_check(self):
+        """REST stop checks for all accounts (fallback if WebSocket missed something)."""
+        checks = [self._check_hard_stops()]
+        if self._account_b_enabled and self.position_manager_b.active_trades:
+            checks.append(self._check_stops_rest(self.trader_b, self.position_manager_b))
+        if self._account_c_enabled and self.position_manager_c.active_trades:
+            checks.append(self._check_stops_rest(self.trader_c, self.position_manager_c))
+        # Accounts are independent I/O; check them concurrently
+        results = await asyncio.gather(*checks, return_exceptions=True)
+        for r in results:
+            if isinstance(r, Exception):
+                logger.error(f"Stop check failed: {r}")
+
+    async def _check_stops_rest(self, trader: AlpacaTrader, pm: PositionManager):
+        """
+        REST fallback for an account's stop/target check.
+
+        One multi-symbol price request instead of one per position.
+        """
+        prices = await trader.get_latest_prices(list(pm.active_trades))
+
+        async def _get_price(sym):
+            return prices.get(sym)
+        await pm.check_stops_and_targets(_get_price)
+
+    async def _run_account_b_poll(self):
+        """Account B: poll patterns and check pending limit orders."""
+        await self._poll_account_b_patterns()
+        await self._check_account_b_pending()
+
+    async def _run_cameron_poll(self):
+        """Cameron checker: poll patterns and check pending orders."""
+        await self._poll_cameron_patterns()
+        await self._check_cameron_pending()
+
+    async def _run_dashboard_update(self):
+        """Dashboard position update (current prices and PnL) for each account."""
+        updates = [("Dashboard", self.position_manager.update_dashboard_positions())]
+        if self._account_b_enabled:
+            updates.append(("Account B dashboard", self.position_manager_b.update_dashboard_positions()))
+        if self._account_c_enabled:
+            updates.append(("Cameron dashboard", self.position_manager_c.update_dashboard_positions()))
+        results = await asyncio.gather(*(c for _, c in updates), return_exceptions=True)
+        for (label, _), r in zip(updates, results):
+            if isinstance(r, Exception):
+                logger.warning(f"{label} position update failed: {r}")
+
+    async def _run_bar_collection(self):
+        """Intraday bar collection, plus old-bar retention when flagged by daily reset."""
+        if self._bar_retention_pending:
+            try:
+                await self.bar_collector.run_retention(
+                    self.config.INTRADAY_BARS_RETENTION_DAYS
+                )
+            except Exception as e:
+                logger.warning(f"Bar retention failed: {e}")
+            self._bar_retention_pending = False
+
+        if self._db_pool:
+            symbols = await self._get_tracked_symbols()
+            if symbols:
+                bars = await self.bar_collector.collect(symbols)
+                if bars:
+                    logger.debug(f"Collected {bars} intraday bars")
+
+    async def _run_hot_options(self):
+        """Hot options detection, refreshing baselines every 30 min."""
+        # _last_baseline_refresh is set from time.time() by the detector
+        if time.time() - (self.hot_detector._last_baseline_refresh or 0) > 1800:
+            await self.hot_detector.refresh_baselines()
+        hot = await self.hot_detector.detect()
+        if hot:
+            await self.hot_detector.flush_to_db(hot)
+            logger.info(f"Hot options: {len(hot)} symbols detected")
+
     async def run(self):
         """
         Main run loop.
@@ -1289,20 +1789,41 @@ class PaperTradingEngine:
         logger.info(f"Dry run: {self.dry_run}")
         logger.info("=" * 60)
 
+        # Create asyncpg pool first so the startup loaders below don't block
+        # the event loop with synchronous queries
+        db_url = os.environ.get("DATABASE_URL")
+        if db_url:
+            try:
+                import asyncpg
+                # Sized for the concurrent users: sink writer, bucket flush,
+                # bar collector, hot options, screeners. Idle connections are
+                # recycled before Cloud SQL drops them.
+                self._db_pool = await asyncpg.create_pool(
+                    db_url.strip(),
+                    min_size=2,
+                    max_size=8,
+                    max_inactive_connection_lifetime=300,
+                    max_queries=50000,
+                    statement_cache_size=256,
+                    command_timeout=30,
+                    init=_init_db_connection,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to create asyncpg pool: {e}")
+
         # Load TA cache
         await self.load_ta_cache()
+        _ta_kernels.warmup()  # JIT-compile on-demand TA before the first signal
 
         # Load per-symbol baselines from database
         await self.load_baselines()
 
-        # Create asyncpg pool for BucketAggregator and symbol tracking
-        db_url = os.environ.get("DATABASE_URL")
-        if db_url:
+        # Pool-backed components: BucketAggregator, detectors, collectors
+        if self._db_pool:
+            self._sink_task = asyncio.create_task(self._sink_consumer())
+            self._ticker_listener_task = asyncio.create_task(
+                self._listen_ticker_changes(db_url.strip()))
             try:
-                import asyncpg
-                self._db_pool = await asyncpg.create_pool(
-                    db_url.strip(), min_size=1, max_size=5, command_timeout=30
-                )
                 self.bucket_aggregator = BucketAggregator(db_pool=self._db_pool)
                 logger.info("BucketAggregator initialized with asyncpg pool")
 
@@ -1337,6 +1858,8 @@ class PaperTradingEngine:
                         secret_key=self._alpaca_secret_key,
                         db_pool=self._db_pool,
                         max_batches=self.config.INTRADAY_BARS_MAX_BATCHES,
+                        # Same Alpaca keys as Account A: share its HTTP session
+                        session_factory=self.trader._get_session,
                     )
                     logger.info(
                         f"IntradayBarCollector initialized: "
@@ -1369,7 +1892,10 @@ class PaperTradingEngine:
                     except Exception as e:
                         logger.warning(f"Cameron pre-load candidates failed: {e}")
             except Exception as e:
-                logger.warning(f"Failed to create asyncpg pool for BucketAggregator: {e}")
+                logger.warning(f"Failed to initialize pool-backed components: {e}")
+
+        # Position syncs for all accounts, run concurrently below
+        startup_syncs = []
 
         # Check account
         if not self.dry_run:
@@ -1383,32 +1909,38 @@ class PaperTradingEngine:
 
             # CRITICAL: Sync existing positions before starting
             # This prevents duplicate trades if we restart with open positions
-            await self.position_manager.sync_on_startup()
+            startup_syncs.append(self.position_manager.sync_on_startup())
 
-        # Start EOD closer
-        self.eod_closer.start()
-
-        # Account B: sync positions and start EOD closer
+        # Account B: sync positions
         if self._account_b_enabled and not self.dry_run:
             account_b = await self.trader_b.get_account()
             if account_b:
                 logger.info(f"Account B: ${account_b.portfolio_value:,.2f} "
                            f"(${account_b.buying_power:,.2f} buying power)")
-            await self.position_manager_b.sync_on_startup()
-            self.eod_closer_b.start()
+            startup_syncs.append(self.position_manager_b.sync_on_startup())
 
-        # Account C: sync positions and start EOD closer
+        # Account C: sync positions
         if self._account_c_enabled and not self.dry_run:
             account_c = await self.trader_c.get_account()
             if account_c:
                 logger.info(f"Account C: ${account_c.portfolio_value:,.2f} "
                            f"(${account_c.buying_power:,.2f} buying power)")
-            await self.position_manager_c.sync_on_startup()
+            startup_syncs.append(self.position_manager_c.sync_on_startup())
+
+        # Accounts are independent; a failed sync still aborts startup
+        await asyncio.gather(*startup_syncs)
+
+        # Start EOD closers
+        self.eod_closer.start()
+        if self._account_b_enabled and not self.dry_run:
+            self.eod_closer_b.start()
+        if self._account_c_enabled and not self.dry_run:
             self.eod_closer_c.start()
 
         # Start stock price WebSocket monitor (PROD-1)
         # Always starts receive loop with retry — initial failure is non-fatal
         if self.config.USE_STOCK_WEBSOCKET:
+            self._price_trigger_task = asyncio.create_task(self._price_trigger_loop())
             logger.info("Starting stock price WebSocket monitor (Alpaca SIP)...")
             stock_monitor_started = await self.stock_monitor.start()
             if stock_monitor_started:
@@ -1421,185 +1953,89 @@ class PaperTradingEngine:
             logger.info("Stock WebSocket disabled by config - using REST polling")
 
         self._running = True
-        signal_check_interval = self.config.SIGNAL_CHECK_INTERVAL_SEC
-        stop_check_interval = self.config.POSITION_CHECK_INTERVAL_SEC
-        subscription_update_interval = 5  # Update subscriptions every 5 seconds
-        dashboard_update_interval = 30  # Update dashboard positions every 30 seconds
-        bar_collect_interval = self.config.INTRADAY_BARS_INTERVAL_SEC
-        account_b_poll_interval = self.config.ACCOUNT_B_POLL_INTERVAL_SEC if self._account_b_enabled else 9999
-        cameron_poll_interval = self.config.CAMERON_POLL_INTERVAL_SEC if self._account_c_enabled else 9999
-        cameron_scan_interval = self.config.CAMERON_SCAN_INTERVAL_SEC if self._account_c_enabled else 9999
-        sparkline_interval = self.config.SPARKLINE_REFRESH_INTERVAL_SEC
-        hot_options_interval = 300  # 5 minutes
-
-        last_signal_check = 0
-        last_stop_check = 0
-        last_subscription_update = 0
-        last_dashboard_update = 0
-        last_bar_collect = 0
-        last_account_b_poll = 0
-        last_cameron_poll = 0
-        last_cameron_scan = 0
-        last_sparkline_refresh = 0
-        last_hot_options_check = 0
-
-        try:
-            async for trade in self.firehose.stream():
-                if not self._running:
-                    break
 
-                # Check for daily reset
-                self._check_daily_reset()
+        # Periodic jobs run as their own tasks so the trade loop only processes trades
+        jobs = [
+            ("Signal check", self.config.SIGNAL_CHECK_INTERVAL_SEC, self._run_signal_check),
+            # Stop check is the fallback if WebSocket missed something
+            ("Stop check", self.config.POSITION_CHECK_INTERVAL_SEC, self._run_stop_check),
+            ("Subscription update", 5, self._update_stock_subscriptions),
+            ("Dashboard position update", 30, self._run_dashboard_update),
+            ("Sparkline refresh", self.config.SPARKLINE_REFRESH_INTERVAL_SEC, self._refresh_sparklines),
+        ]
+        if self._account_b_enabled:
+            jobs.append(("Account B poll/check", self.config.ACCOUNT_B_POLL_INTERVAL_SEC,
+                         self._run_account_b_poll))
+        if self._account_c_enabled:
+            jobs.append(("Cameron scan", self.config.CAMERON_SCAN_INTERVAL_SEC, self._cameron_scan_tick))
+            jobs.append(("Cameron poll/check", self.config.CAMERON_POLL_INTERVAL_SEC,
+                         self._run_cameron_poll))
+        if self.bar_collector:
+            jobs.append(("Intraday bar collection", self.config.INTRADAY_BARS_INTERVAL_SEC,
+                         self._run_bar_collection))
+        if self.hot_detector:
+            jobs.append(("Hot options detection", 300, self._run_hot_options))
+
+        self._periodic_tasks = [
+            asyncio.create_task(self._periodic(name, interval, fn))
+            for name, interval, fn in jobs
+        ]
+        self._periodic_tasks.append(asyncio.create_task(self._health_tick()))
+
+        # Trade-loop gate state lives in locals (cheaper than attribute access per trade)
+        reset_check_sec = float(self.config.DAILY_RESET_CHECK_SEC)
+        last_reset_check = 0.0  # monotonic
+        monotonic = time.monotonic
+        self._trade_workers = [
+            asyncio.create_task(self._trade_worker())
+            for _ in range(self.config.TRADE_WORKERS)
+        ]
+        trade_q = self._trade_q
+        backpressure = self.config.TRADE_QUEUE_BACKPRESSURE
 
-                # Skip if outside trading hours
-                if not self._is_trading_hours():
+        try:
+            while self._running:
+                # Outside trading hours, stay disconnected rather than
+                # streaming trades only to discard them
+                wait = self._seconds_until_open()
+                if wait > 0:
+                    await asyncio.sleep(min(wait, 60))
                     continue
 
-                # Process trade
-                await self._process_trade(trade)
-
-                # Periodic signal check
-                now = asyncio.get_event_loop().time()
-                if now - last_signal_check >= signal_check_interval:
-                    await self._check_for_signals()
-                    last_signal_check = now
-
-                    # v58: Momentum screener time-based checks (inside signal interval)
-                    if self._momentum_screener:
-                        now_et = self._get_et_now()
-                        now_time = now_et.time()
-
-                        # Run momentum screen at 3:50 PM
-                        if (not self._momentum_screened_today
-                                and now_time >= self.config.MOMENTUM_SCREEN_TIME):
+                logger.info("Trading hours: streaming firehose")
+                # stream() reconnects on its own until disconnect(), which the
+                # close timer (or shutdown) calls
+                close_timer = asyncio.create_task(self._disconnect_firehose_at_close())
+                try:
+                    async with aclosing(self.firehose.stream()) as trades:
+                        async for trade in trades:
+                            if not self._running:
+                                break
+
+                            # Daily reset only changes once a day, so re-evaluate
+                            # it on an interval rather than per trade
+                            now = monotonic()
+                            if now - last_reset_check >= reset_check_sec:
+                                self._check_daily_reset()
+                                last_reset_check = now
+
+                            # Hand off to the trade workers
                             try:
-                                self._momentum_candidates = await self._momentum_screener.screen()
-                                self._momentum_screened_today = True
-                                logger.info(f"Momentum screen complete: {len(self._momentum_candidates)} candidates")
-                            except Exception as e:
-                                logger.error(f"Momentum screen failed: {e}")
-                                self._momentum_screened_today = True  # Don't retry
-
-                        # Execute momentum buys at 3:56 PM (after EOD closer runs at 3:55)
-                        if (self._momentum_candidates
-                                and not self._momentum_bought_today
-                                and now_time >= self.config.MOMENTUM_BUY_TIME):
-                            await self._execute_momentum_buys()
-                            self._momentum_bought_today = True
-
-                # Periodic stop check (fallback if WebSocket missed something)
-                if now - last_stop_check >= stop_check_interval:
-                    await self._check_hard_stops()
-                    # Account B: REST fallback for stop/target check
-                    if self._account_b_enabled and self.position_manager_b.active_trades:
-                        async def _get_price_b(sym):
-                            return await self.trader_b.get_latest_price(sym)
-                        await self.position_manager_b.check_stops_and_targets(_get_price_b)
-                    # Account C: REST fallback for stop/target check
-                    if self._account_c_enabled and self.position_manager_c.active_trades:
-                        async def _get_price_c(sym):
-                            return await self.trader_c.get_latest_price(sym)
-                        await self.position_manager_c.check_stops_and_targets(_get_price_c)
-                    last_stop_check = now
-
-                # Account B: poll patterns and check pending limit orders
-                if self._account_b_enabled and now - last_account_b_poll >= account_b_poll_interval:
-                    try:
-                        await self._poll_account_b_patterns()
-                        await self._check_account_b_pending()
-                    except Exception as e:
-                        logger.warning(f"Account B poll/check failed: {e}")
-                    last_account_b_poll = now
-
-                # Cameron scanner: run pattern detection every 60s
-                if self._account_c_enabled and now - last_cameron_scan >= cameron_scan_interval:
-                    try:
-                        await self._cameron_scan_tick()
-                    except Exception as e:
-                        logger.warning(f"Cameron scan failed: {e}")
-                    last_cameron_scan = now
-
-                # Cameron checker: poll patterns and check pending orders every 30s
-                if self._account_c_enabled and now - last_cameron_poll >= cameron_poll_interval:
-                    try:
-                        await self._poll_cameron_patterns()
-                        await self._check_cameron_pending()
-                    except Exception as e:
-                        logger.warning(f"Cameron poll/check failed: {e}")
-                    last_cameron_poll = now
-
-                # Periodic subscription update for stock monitor
-                if now - last_subscription_update >= subscription_update_interval:
-                    await self._update_stock_subscriptions()
-                    last_subscription_update = now
-
-                # Periodic dashboard position update (current prices and PnL)
-                if now - last_dashboard_update >= dashboard_update_interval:
-                    try:
-                        await self.position_manager.update_dashboard_positions()
-                    except Exception as e:
-                        logger.warning(f"Dashboard position update failed: {e}")
-                    if self._account_b_enabled:
-                        try:
-                            await self.position_manager_b.update_dashboard_positions()
-                        except Exception as e:
-                            logger.warning(f"Account B dashboard position update failed: {e}")
-                    if self._account_c_enabled:
-                        try:
-                            await self.position_manager_c.update_dashboard_positions()
-                        except Exception as e:
-                            logger.warning(f"Cameron dashboard position update failed: {e}")
-                    last_dashboard_update = now
-
-                # Periodic intraday bar collection
-                if self.bar_collector and now - last_bar_collect >= bar_collect_interval:
-                    try:
-                        if self._db_pool:
-                            async with self._db_pool.acquire() as conn:
-                                rows = await conn.fetch(
-                                    "SELECT symbol FROM tracked_tickers_v2 "
-                                    "WHERE ta_enabled = TRUE ORDER BY symbol"
-                                )
-                                symbols = [r['symbol'] for r in rows]
-                            if symbols:
-                                bars = await self.bar_collector.collect(symbols)
-                                if bars:
-                                    logger.debug(f"Collected {bars} intraday bars")
-                    except Exception as e:
-                        logger.warning(f"Intraday bar collection failed: {e}")
-                    last_bar_collect = now
-
-                # Periodic sparkline refresh (every 5 min, after bars collected)
-                if now - last_sparkline_refresh >= sparkline_interval:
-                    try:
-                        await self._refresh_sparklines()
-                    except Exception as e:
-                        logger.warning(f"Sparkline refresh failed: {e}")
-                    last_sparkline_refresh = now
-
-                # Hot options detection (every 5 min)
-                if self.hot_detector and now - last_hot_options_check >= hot_options_interval:
-                    try:
-                        # Refresh baselines every 30 min
-                        if now - (self.hot_detector._last_baseline_refresh or 0) > 1800:
-                            await self.hot_detector.refresh_baselines()
-                        hot = await self.hot_detector.detect()
-                        if hot:
-                            await self.hot_detector.flush_to_db(hot)
-                            logger.info(f"Hot options: {len(hot)} symbols detected")
-                    except Exception as e:
-                        logger.warning(f"Hot options detection failed: {e}")
-                    last_hot_options_check = now
-
-                # Run bar retention if flagged by daily reset
-                if self._bar_retention_pending and self.bar_collector:
-                    try:
-                        await self.bar_collector.run_retention(
-                            self.config.INTRADAY_BARS_RETENTION_DAYS
-                        )
-                    except Exception as e:
-                        logger.warning(f"Bar retention failed: {e}")
-                    self._bar_retention_pending = False
+                                trade_q.put_nowait(trade)
+                            except asyncio.QueueFull:
+                                if backpressure:
+                                    # Stall the read until a worker frees a slot
+                                    await trade_q.put(trade)
+                                    continue
+                                self._trades_dropped += 1
+                                if self._trades_dropped % 10_000 == 1:
+                                    logger.warning(f"Trade queue full, dropped {self._trades_dropped} trades so far")
+                finally:
+                    close_timer.cancel()
+
+                await self.firehose.disconnect()
+                if self._running:
+                    logger.info("Outside trading hours: firehose disconnected until next open")
 
         except KeyboardInterrupt:
             logger.info("Shutdown requested...")
@@ -1611,48 +2047,81 @@ class PaperTradingEngine:
         finally:
             await self.shutdown()
 
+    async def _gather_shutdown(self, steps):
+        """Run labelled shutdown coroutines concurrently; one failure doesn't skip the rest."""
+        if not steps:
+            return
+        results = await asyncio.gather(*(c for _, c in steps), return_exceptions=True)
+        for (label, _), r in zip(steps, results):
+            if isinstance(r, Exception):
+                logger.error(f"{label} failed during shutdown: {r}")
+
     async def shutdown(self):
         """Clean shutdown."""
         logger.info("Shutting down...")
 
-        self._running = False
+        self._running = False  # Stops the firehose read loop (the trade producer)
+        for task in self._periodic_tasks:
+            task.cancel()
+
+        # Let the workers finish trades already queued before stopping them
+        if self._trade_workers:
+            try:
+                await asyncio.wait_for(self._trade_q.join(), timeout=self.config.TRADE_QUEUE_DRAIN_SEC)
+            except asyncio.TimeoutError:
+                logger.warning(f"Trade queue not drained at shutdown: {self._trade_q.qsize()} trades left")
+            for task in self._trade_workers:
+                task.cancel()
         self.eod_closer.stop()
 
-        # Account B shutdown
+        # Account B/C shutdown: cancel pending limit orders (accounts are independent)
+        cleanup = []
         if self._account_b_enabled:
             if hasattr(self, 'eod_closer_b'):
                 self.eod_closer_b.stop()
-            # Cancel any pending limit orders
-            await self.position_manager_b.cancel_all_pending_limit_orders()
-
-        # Account C shutdown
+            cleanup.append(("Account B order cancel", self.position_manager_b.cancel_all_pending_limit_orders()))
         if self._account_c_enabled:
             if hasattr(self, 'eod_closer_c'):
                 self.eod_closer_c.stop()
-            await self.position_manager_c.cancel_all_pending_limit_orders()
+            cleanup.append(("Account C order cancel", self.position_manager_c.cancel_all_pending_limit_orders()))
             if self.cameron_scanner:
-                await self.cameron_scanner.close()
+                cleanup.append(("Cameron scanner close", self.cameron_scanner.close()))
+        await self._gather_shutdown(cleanup)
 
         # Only close positions on intentional shutdown (KeyboardInterrupt / EOD)
         # Do NOT close on code crashes — positions are safer left open
         if self._graceful_shutdown and self._is_trading_hours() and not self.dry_run:
             logger.warning("Closing positions on graceful shutdown...")
-            await self.position_manager.close_all_positions(reason="shutdown")
+            closes = [("Position close", self.position_manager.close_all_positions(reason="shutdown"))]
             if self._account_b_enabled:
-                await self.position_manager_b.close_all_positions(reason="shutdown")
+                closes.append(("Account B position close", self.position_manager_b.close_all_positions(reason="shutdown")))
             if self._account_c_enabled:
-                await self.position_manager_c.close_all_positions(reason="shutdown")
+                closes.append(("Account C position close", self.position_manager_c.close_all_positions(reason="shutdown")))
+            await self._gather_shutdown(closes)
         elif not self._graceful_shutdown:
             logger.warning("Crash shutdown — preserving positions (not closing)")
 
+        # Let queued trade-log writes (including the closes above) reach the DB
+        flushes = [("Trade log flush", self.position_manager.flush_db_writes())]
+        if self._account_b_enabled:
+            flushes.append(("Account B trade log flush", self.position_manager_b.flush_db_writes()))
+        if self._account_c_enabled:
+            flushes.append(("Account C trade log flush", self.position_manager_c.flush_db_writes()))
+        await self._gather_shutdown(flushes)
+
         # Stop stock price monitor
+        if self._price_trigger_task:
+            self._price_trigger_task.cancel()
         await self.stock_monitor.stop()
         logger.info(f"Stock monitor metrics: {self.stock_monitor.get_metrics()}")
 
-        # Flush remaining bucket data
+        # Flush remaining bucket data (after any boundary flush still in flight)
         if self.bucket_aggregator:
+            if self._bucket_flush_tasks:
+                await asyncio.gather(*self._bucket_flush_tasks, return_exceptions=True)
             try:
-                rows = await self.bucket_aggregator.flush()
+                async with self._bucket_flush_lock:
+                    rows = await self.bucket_aggregator.flush()
                 if rows:
                     logger.info(f"Shutdown: flushed {rows} remaining baseline rows")
             except Exception:
@@ -1669,18 +2138,38 @@ class PaperTradingEngine:
             except Exception:
                 pass
 
+        if self._ticker_listener_task:
+            self._ticker_listener_task.cancel()
+
+        # Stop the sink consumer and write whatever is still queued
+        if self._sink_task:
+            self._sink_task.cancel()
+            try:
+                await self._sink_task
+            except asyncio.CancelledError:
+                pass
+            pending = self._drain_sink_queue()
+            if pending:
+                await self._flush_sink(pending)
+                logger.info(f"Shutdown: flushed {len(pending)} queued DB writes")
+
         if self._db_pool:
             await self._db_pool.close()
             logger.info("Asyncpg pool closed")
 
-        await self.firehose.disconnect()
-        await self.trader.close()
+        # Independent connections; close them concurrently
+        closers = [
+            ("Firehose disconnect", self.firehose.disconnect()),
+            ("Trader close", self.trader.close()),
+            ("Signal generator close", self.signal_generator.close()),
+        ]
         if self._account_b_enabled and hasattr(self, 'trader_b'):
-            await self.trader_b.close()
+            closers.append(("Account B trader close", self.trader_b.close()))
         if self._account_c_enabled and hasattr(self, 'trader_c'):
-            await self.trader_c.close()
+            closers.append(("Account C trader close", self.trader_c.close()))
         if self.engulfing_trader:
-            await self.engulfing_trader.close()
+            closers.append(("Engulfing trader close", self.engulfing_trader.close()))
+        await self._gather_shutdown(closers)
 
         # Log final stats
         logger.info(f"Signal filter stats: {self.signal_filter.get_stats()}")
@@ -1691,33 +2180,33 @@ class PaperTradingEngine:
 
 # Global health status for HTTP health check
 _health_status = {"status": "starting", "trades": 0, "positions": 0, "last_update": None}
+# Fixed schema, so the body is filled in with bytes formatting rather
+# than serialized (values are numbers and ASCII status/ISO strings)
+_HEALTH_TEMPLATE = (
+    b'{"status":"%s","trades":%d,"positions":%d,"trades_dropped":%d,'
+    b'"last_update":"%s","db_pool":{"size":%d,"idle":%d}}'
+)
+_health_body = b""  # Rendered by PaperTradingEngine._health_tick
 
 
-class HealthHandler(BaseHTTPRequestHandler):
-    """Simple HTTP handler for Cloud Run health checks."""
-
-    def do_GET(self):
-        if self.path == "/" or self.path == "/health":
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            _health_status["last_update"] = datetime.now(ET).isoformat()
-            self.wfile.write(json.dumps(_health_status).encode())
-        else:
-            self.send_response(404)
-            self.end_headers()
-
-    def log_message(self, format, *args):
-        pass  # Suppress HTTP logs
+async def _handle_health(request: web.Request) -> web.Response:
+    """Cloud Run health check, served on the engine's event loop."""
+    # Before the first engine tick, serialize the startup status
+    body = _health_body or orjson.dumps(_health_status)
+    # bytes body: aiohttp sends an explicit Content-Length (no chunking)
+    return web.Response(body=body, content_type="application/json")
 
 
-def start_health_server(port: int = 8080):
-    """Start HTTP health check server in background thread."""
-    server = HTTPServer(("0.0.0.0", port), HealthHandler)
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
+async def start_health_server(port: int = 8080) -> web.AppRunner:
+    """Start HTTP health check server on the running event loop."""
+    app = web.Application()
+    app.router.add_get("/", _handle_health)
+    app.router.add_get("/health", _handle_health)
+    runner = web.AppRunner(app, access_log=None)  # Suppress HTTP logs
+    await runner.setup()
+    await web.TCPSite(runner, "0.0.0.0", port).start()
     logger.info(f"Health check server started on port {port}")
-    return server
+    return runner
 
 
 async def main():
@@ -1837,7 +2326,7 @@ async def main():
 
     # Start health check server for Cloud Run
     health_port = int(os.environ.get("PORT", 8080))
-    start_health_server(health_port)
+    health_runner = await start_health_server(health_port)
     _health_status["status"] = "running"
 
     # Run main engine
@@ -1847,9 +2336,14 @@ async def main():
         alpaca_secret_key=alpaca_secret,
         dry_run=args.dry_run,
     )
-
-    await engine.run()
+    try:
+        await engine.run()
+    finally:
+        await health_runner.cleanup()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Loop factory rather than uvloop.install() (deprecated on 3.12+)
+    loop_factory = uvloop.new_event_loop if HAS_UVLOOP else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
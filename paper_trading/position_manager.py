@@ -7,22 +7,25 @@ Tracks positions, enforces limits, and manages trade state.
 import asyncio
 import logging
 import math
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Optional, List, Dict, Callable, Awaitable
+from typing import Optional, List, Dict, Deque, Callable, Awaitable
 
 from .config import TradingConfig, DEFAULT_CONFIG
 from .alpaca_trader import AlpacaTrader, Position, Order, OrderType, OrderSide
 from .dashboard import (
     get_dashboard, update_signal_trade_placed, close_signal_in_db,
     log_trade_open, log_trade_close, load_open_trades_from_db,
+    log_trades_open_bulk, log_trades_close_bulk,
 )
 import os
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a trade for tracking."""
     symbol: str
@@ -53,7 +56,7 @@ class TradeRecord:
     article_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily trading statistics."""
     date: date
@@ -91,12 +94,14 @@ class PositionManager:
         self.trades_table = trades_table
         self.skip_dashboard = skip_dashboard
         self._dashboard_override = dashboard
+        # Read once; the environment doesn't change while the engine runs
+        self._db_url = os.environ.get("DATABASE_URL")
 
         # Active trades (symbol -> TradeRecord)
         self.active_trades: Dict[str, TradeRecord] = {}
 
-        # Completed trades (today)
-        self.completed_trades: List[TradeRecord] = []
+        # Completed trades (today; most recent MAX_COMPLETED_TRADES_MEMORY)
+        self.completed_trades: Deque[TradeRecord] = deque(maxlen=config.MAX_COMPLETED_TRADES_MEMORY)
 
         # Daily stats
         self.daily_stats = DailyStats(date=date.today())
@@ -113,6 +118,79 @@ class PositionManager:
         # Symbols with close in progress (prevents WS + REST race)
         self._closing_in_progress: set = set()
 
+        # Shared Alpaca positions snapshot (see _positions_snapshot)
+        self._pos_cache: Optional[List[Position]] = None
+        self._pos_cache_t = 0.0
+        self._pos_fetch: Optional[asyncio.Future] = None
+        self._pos_gen = 0  # Bumped by _invalidate_positions; older fetches don't populate the cache
+
+        # Trade-log DB writes, run in order off the event loop (see _queue_db_write)
+        self._db_write_q: Optional[asyncio.Queue] = None
+        self._db_writer_task: Optional[asyncio.Task] = None
+
+    async def _positions_snapshot(self, max_age: float = 0.2) -> List[Position]:
+        """
+        Alpaca positions, shared by callers within max_age seconds.
+
+        The stop check, position sync and dashboard refresh often run on the
+        same tick; concurrent callers await one in-flight request.
+        """
+        if self._pos_cache is not None and time.monotonic() - self._pos_cache_t < max_age:
+            return self._pos_cache
+        if self._pos_fetch is None:
+            self._pos_fetch = asyncio.ensure_future(self._fetch_positions(self._pos_gen))
+        return await asyncio.shield(self._pos_fetch)
+
+    async def _fetch_positions(self, gen: int) -> List[Position]:
+        """Fetch positions into the shared snapshot (unless invalidated meanwhile)."""
+        try:
+            positions = await self.trader.get_positions()
+            if gen == self._pos_gen:
+                self._pos_cache = positions
+                self._pos_cache_t = time.monotonic()
+            return positions
+        finally:
+            if self._pos_fetch is asyncio.current_task():
+                self._pos_fetch = None
+
+    def _invalidate_positions(self):
+        """Drop the positions snapshot after an order changes holdings."""
+        self._pos_gen += 1
+        self._pos_cache = None
+        self._pos_fetch = None  # Next caller starts a fresh fetch; an in-flight one is discarded
+
+    def _queue_db_write(self, fn: Callable[[], None]):
+        """
+        Queue a blocking DB write to run on a worker thread, in submission order.
+
+        Keeps psycopg2 round-trips off the close path and dashboard updates.
+        Trade opens are not queued: they are written before open_position
+        returns, so a crash never leaves a live position without its row.
+        """
+        if self._db_writer_task is None:
+            self._db_write_q = asyncio.Queue()
+            self._db_writer_task = asyncio.create_task(self._db_writer())
+        self._db_write_q.put_nowait(fn)
+
+    async def _db_writer(self):
+        """Run queued DB writes one at a time."""
+        while True:
+            fn = await self._db_write_q.get()
+            try:
+                await asyncio.to_thread(fn)
+            except Exception as e:
+                logger.warning(f"Queued DB write failed: {e}")
+            finally:
+                self._db_write_q.task_done()
+
+    async def flush_db_writes(self):
+        """Wait for queued DB writes to finish, then stop the writer."""
+        if self._db_writer_task is None:
+            return
+        await self._db_write_q.join()
+        self._db_writer_task.cancel()
+        self._db_writer_task = None
+
     def _get_dashboard(self):
         """Get the dashboard instance (override or singleton)."""
         if self._dashboard_override is not None:
@@ -121,7 +199,7 @@ class PositionManager:
 
     def reset_daily(self):
         """Reset for new trading day."""
-        self.completed_trades = []
+        self.completed_trades = deque(maxlen=self.config.MAX_COMPLETED_TRADES_MEMORY)
         self.daily_stats = DailyStats(date=date.today())
         self.traded_today = set()
         self._pending_buys = set()
@@ -142,7 +220,10 @@ class PositionManager:
     @property
     def can_open_position(self) -> bool:
         """Check if we can open a new position (includes pending orders)."""
-        total_positions = self.num_positions + self.num_pending
+        # Read per triggered symbol in the signal loop; sum the lens directly
+        # rather than going through the num_positions/num_pending properties
+        total_positions = (len(self.active_trades) + len(self._pending_buys)
+                           + len(self._pending_limit_orders))
         return total_positions < self.config.MAX_CONCURRENT_POSITIONS
 
     def already_traded(self, symbol: str) -> bool:
@@ -157,9 +238,18 @@ class PositionManager:
                 or symbol in self._pending_buys
                 or symbol in self._pending_limit_orders)
 
+    def blocked_symbols(self) -> frozenset:
+        """
+        Snapshot of symbols that fail already_traded() or has_position().
+
+        For checking many candidates at once with set membership.
+        """
+        return frozenset(self.traded_today.union(
+            self.active_trades, self._pending_buys, self._pending_limit_orders))
+
     async def sync_positions(self):
         """Sync local state with Alpaca positions."""
-        positions = await self.trader.get_positions()
+        positions = await self._positions_snapshot()
 
         # Update or add positions we have
         alpaca_symbols = set()
@@ -174,16 +264,15 @@ class PositionManager:
                     symbol=pos.symbol,
                     entry_time=datetime.now(),
                     entry_price=pos.avg_entry_price,
-                    shares=int(pos.qty),
+                    shares=pos.shares,
                     signal_score=0,
                     signal_rsi=0,
                     signal_notional=0,
                 )
 
         # Remove positions that were closed
-        closed = [s for s in self.active_trades if s not in alpaca_symbols]
-        for symbol in closed:
-            trade = self.active_trades.pop(symbol)
+        for symbol in self.active_trades.keys() - alpaca_symbols:
+            del self.active_trades[symbol]
             logger.info(f"Position {symbol} no longer open (external close)")
 
     async def sync_on_startup(self):
@@ -196,9 +285,10 @@ class PositionManager:
         - Alpaca only (no DB record): External trade — create DB record with zeroed signal metadata
         """
         logger.info("Syncing positions at startup (3-way reconciliation)...")
+        now = datetime.now()  # One timestamp for every record this reconciliation writes
 
         # 1. Load open trades from paper_trades_log (or paper_trades_log_b)
-        db_url = os.environ.get("DATABASE_URL")
+        db_url = self._db_url
         db_trades = {}
         if db_url:
             raw = load_open_trades_from_db(db_url, table_name=self.trades_table)
@@ -211,16 +301,24 @@ class PositionManager:
         alpaca_map = {pos.symbol: pos for pos in positions}
         logger.info(f"Found {len(alpaca_map)} Alpaca positions")
 
+        # Classify in one pass: (DB + Alpaca), DB only, Alpaca only
+        both, db_only = [], []
+        for symbol, db in db_trades.items():
+            pos = alpaca_map.get(symbol)
+            if pos is None:
+                db_only.append((symbol, db))
+            else:
+                both.append((symbol, db, pos))
+        orphaned = sorted(alpaca_map.keys() - db_trades.keys())
+
         # Case A: DB + Alpaca — restore with full metadata
-        for symbol in set(db_trades) & set(alpaca_map):
-            db = db_trades[symbol]
-            pos = alpaca_map[symbol]
+        for symbol, db, pos in both:
             self.traded_today.add(symbol)
             self.active_trades[symbol] = TradeRecord(
                 symbol=symbol,
-                entry_time=db["entry_time"] or datetime.now(),
+                entry_time=db["entry_time"] or now,
                 entry_price=pos.avg_entry_price,
-                shares=int(pos.qty),
+                shares=pos.shares,
                 signal_score=db["signal_score"],
                 signal_rsi=db["signal_rsi"],
                 signal_notional=db["signal_notional"],
@@ -240,54 +338,44 @@ class PositionManager:
                        f"direction={db.get('direction', 'bullish')})")
 
         # Case B: DB only — position closed externally or during crash
-        for symbol in set(db_trades) - set(alpaca_map):
-            db = db_trades[symbol]
+        # (all marked closed in one batched DB write)
+        crash_closes = []
+        for symbol, db in db_only:
             self.traded_today.add(symbol)
-            if db_url:
-                log_trade_close(
-                    db_url=db_url,
-                    trade_db_id=db["db_id"],
-                    symbol=symbol,
-                    exit_time=datetime.now(),
-                    exit_price=db["entry_price"],
-                    pnl=0.0,
-                    pnl_pct=0.0,
-                    exit_reason="crash_recovery",
-                    table_name=self.trades_table,
-                )
+            crash_closes.append(
+                (now, db["entry_price"], 0.0, 0.0, "crash_recovery", db["db_id"])
+            )
             logger.warning(f"DB-only (no Alpaca position): {symbol} — marked closed as crash_recovery")
+        if db_url and crash_closes:
+            log_trades_close_bulk(db_url, crash_closes, table_name=self.trades_table)
 
         # Case C: Alpaca only — orphaned position, no DB record.
         # Adopt into active_trades and create a DB record so future restarts
         # see them as Case A. Normal exit logic (EOD closer / hard stop)
         # handles closing at the right time.
-        orphaned = set(alpaca_map) - set(db_trades)
         if orphaned:
-            logger.warning(f"Found {len(orphaned)} orphaned Alpaca positions (no DB record): "
-                          f"{sorted(orphaned)}")
-            for symbol in orphaned:
+            logger.warning("Found %d orphaned Alpaca positions (no DB record): %s",
+                           len(orphaned), orphaned)
+            # Create DB records (one batched insert) so future restarts find them as Case A
+            trade_db_ids = [None] * len(orphaned)
+            if db_url:
+                trade_db_ids = log_trades_open_bulk(
+                    db_url,
+                    [(symbol, now, alpaca_map[symbol].avg_entry_price,
+                      alpaca_map[symbol].shares, 0, 0, 0)
+                     for symbol in orphaned],
+                    table_name=self.trades_table,
+                )
+
+            for symbol, trade_db_id in zip(orphaned, trade_db_ids):
                 pos = alpaca_map[symbol]
                 self.traded_today.add(symbol)
 
-                # Create DB record so future restarts find them as Case A
-                trade_db_id = None
-                if db_url:
-                    try:
-                        trade_db_id = log_trade_open(
-                            db_url=db_url, symbol=symbol,
-                            entry_time=datetime.now(), entry_price=pos.avg_entry_price,
-                            shares=int(pos.qty), signal_score=0,
-                            signal_rsi=0, signal_notional=0,
-                            table_name=self.trades_table,
-                        )
-                    except Exception as e:
-                        logger.error(f"Failed to create DB record for orphan {symbol}: {e}")
-
                 self.active_trades[symbol] = TradeRecord(
                     symbol=symbol,
-                    entry_time=datetime.now(),
+                    entry_time=now,
                     entry_price=pos.avg_entry_price,
-                    shares=int(pos.qty),
+                    shares=pos.shares,
                     signal_score=0,
                     signal_rsi=0,
                     signal_notional=0,
@@ -308,12 +396,19 @@ class PositionManager:
 
         Returns number of shares to buy.
         """
-        account = await self.trader.get_account()
+        # Independent requests; fetch them concurrently
+        account, price = await asyncio.gather(
+            self.trader.get_account(),
+            self.trader.get_latest_price(symbol),
+        )
+        return self._size_from(symbol, account, price)
+
+    def _size_from(self, symbol: str, account, price: Optional[float]) -> int:
+        """Shares to buy given an already-fetched account and latest price (0 if either is missing)."""
         if not account:
             logger.error("Failed to get account for position sizing")
             return 0
 
-        price = await self.trader.get_latest_price(symbol)
         if not price or price <= 0:
             logger.error(f"Failed to get price for {symbol}")
             return 0
@@ -369,16 +464,7 @@ class PositionManager:
             logger.info(f"Already have position in {symbol}")
             return None
 
-        # CRITICAL: Check actual Alpaca positions before buying
-        # This catches any positions opened outside our tracking
-        existing_position = await self.trader.get_position(symbol)
-        if existing_position:
-            logger.warning(f"Already have Alpaca position in {symbol} "
-                          f"({existing_position.qty} shares) - syncing state")
-            self.traded_today.add(symbol)
-            return None
-
-        # CRITICAL: Mark as pending BEFORE calculating size or submitting order
+        # CRITICAL: Mark as pending BEFORE any request or order submission
         # This prevents duplicate orders during async operations
         self._pending_buys.add(symbol)
         self.traded_today.add(symbol)
@@ -386,32 +472,45 @@ class PositionManager:
                    f"(positions: {self.num_positions}, pending: {self.num_pending})")
 
         try:
+            # Existing-position check and sizing inputs are independent; fetch together
+            existing_position, account, price = await asyncio.gather(
+                self.trader.get_position(symbol),
+                self.trader.get_account(),
+                self.trader.get_latest_price(symbol),
+            )
+
+            # CRITICAL: Check actual Alpaca positions before buying
+            # This catches any positions opened outside our tracking
+            if existing_position:
+                logger.warning(f"Already have Alpaca position in {symbol} "
+                              f"({existing_position.qty} shares) - syncing state")
+                return None
+
             # Calculate position size
-            shares = await self.calculate_position_size(symbol)
+            shares = self._size_from(symbol, account, price)
             if shares <= 0:
                 logger.warning(f"Position size 0 for {symbol}")
                 return None
 
             # Submit buy order
             order = await self.trader.buy(symbol, shares)
+            self._invalidate_positions()
             if not order:
                 logger.error(f"Failed to submit buy order for {symbol}")
                 return None
 
-            # Wait for fill with retry (market open fills can take >2s)
+            # Wait for fill (market open fills can take several seconds; 18s max)
             position = None
-            for attempt in range(4):  # 2s + 3s + 5s + 8s = 18s max
-                wait = [2, 3, 5, 8][attempt]
-                await asyncio.sleep(wait)
-
-                filled_order = await self.trader.get_order(order.id)
-                if filled_order and filled_order.filled_qty and int(filled_order.filled_qty) > 0:
+            filled_order = await self.trader.wait_for_fill(order.id, timeout=18.0)
+            if filled_order and filled_order.filled_qty and int(filled_order.filled_qty) > 0:
+                # The positions endpoint can trail the fill by a moment
+                for _ in range(3):
                     position = await self.trader.get_position(symbol)
                     if position:
                         break
-
-                logger.warning(f"Order not filled yet for {symbol} "
-                              f"(attempt {attempt + 1}/4, waited {wait}s)")
+                    await asyncio.sleep(0.5)
+            else:
+                logger.warning(f"Order not filled for {symbol} after 18s")
 
             if not position:
                 logger.error(f"Position not found after buy: {symbol} — "
@@ -423,7 +522,7 @@ class PositionManager:
                 symbol=symbol,
                 entry_time=datetime.now(),
                 entry_price=position.avg_entry_price,
-                shares=int(position.qty),
+                shares=position.shares,
                 signal_score=signal_score,
                 signal_rsi=signal_rsi,
                 signal_notional=signal_notional,
@@ -442,10 +541,11 @@ class PositionManager:
                 if dashboard.enabled:
                     dashboard.update_position(symbol, trade.entry_price, trade.entry_price, "HOLDING", score=trade.signal_score)
 
-            # Persist trade to DB
-            db_url = os.environ.get("DATABASE_URL")
+            # Persist trade to DB before returning (so startup sync sees it); off the loop
+            db_url = self._db_url
             if db_url:
-                trade.trade_db_id = log_trade_open(
+                trade.trade_db_id = await asyncio.to_thread(
+                    log_trade_open,
                     db_url=db_url,
                     symbol=trade.symbol,
                     entry_time=trade.entry_time,
@@ -458,7 +558,9 @@ class PositionManager:
                     volume_ratio=volume_ratio,
                 )
                 if not self.skip_dashboard:
-                    update_signal_trade_placed(db_url, symbol, trade.entry_price)
+                    self._queue_db_write(
+                        lambda: update_signal_trade_placed(db_url, symbol, trade.entry_price)
+                    )
 
             return trade
 
@@ -500,15 +602,16 @@ class PositionManager:
 
             # Close position
             order = await self.trader.close_position(symbol)
+            self._invalidate_positions()
             if not order:
                 logger.error(f"Failed to close position {symbol}")
                 return None
 
-            # Wait for fill
-            await asyncio.sleep(2)
+            # Wait for fill (bounded by the old fixed 2s wait)
+            filled_order = await self.trader.wait_for_fill(order.id, timeout=2.0)
 
             # Get exit price
-            exit_price = order.filled_avg_price
+            exit_price = (filled_order and filled_order.filled_avg_price) or order.filled_avg_price
             if not exit_price:
                 # Try to get from latest trade
                 latest = await self.trader.get_latest_price(symbol)
@@ -552,22 +655,24 @@ class PositionManager:
                         score=trade.signal_score,
                     )
 
-            # Persist trade close to DB
-            db_url = os.environ.get("DATABASE_URL")
+            # Persist trade close to DB (queued; the open was written synchronously)
+            db_url = self._db_url
             if db_url:
-                log_trade_close(
-                    db_url=db_url,
-                    trade_db_id=trade.trade_db_id,
-                    symbol=trade.symbol,
-                    exit_time=trade.exit_time,
-                    exit_price=trade.exit_price,
-                    pnl=trade.pnl,
-                    pnl_pct=trade.pnl_pct,
-                    exit_reason=trade.exit_reason,
-                    table_name=self.trades_table,
-                )
-                if not self.skip_dashboard:
-                    close_signal_in_db(db_url, symbol, exit_price, trade.pnl_pct)
+                def _write_close():
+                    log_trade_close(
+                        db_url=db_url,
+                        trade_db_id=trade.trade_db_id,
+                        symbol=trade.symbol,
+                        exit_time=trade.exit_time,
+                        exit_price=trade.exit_price,
+                        pnl=trade.pnl,
+                        pnl_pct=trade.pnl_pct,
+                        exit_reason=trade.exit_reason,
+                        table_name=self.trades_table,
+                    )
+                    if not self.skip_dashboard:
+                        close_signal_in_db(db_url, symbol, exit_price, trade.pnl_pct)
+                self._queue_db_write(_write_close)
 
             return trade
 
@@ -575,14 +680,19 @@ class PositionManager:
             self._closing_in_progress.discard(symbol)
 
     async def close_all_positions(self, reason: str = "eod") -> List[TradeRecord]:
-        """Close all open positions."""
-        closed = []
+        """Close all open positions (concurrently, so each close's fill wait overlaps)."""
         symbols = list(self.active_trades.keys())
+        results = await asyncio.gather(
+            *(self.close_position(symbol, reason) for symbol in symbols),
+            return_exceptions=True,
+        )
 
-        for symbol in symbols:
-            trade = await self.close_position(symbol, reason)
-            if trade:
-                closed.append(trade)
+        closed = []
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to close {symbol}: {result}")
+            elif result:
+                closed.append(result)
 
         return closed
 
@@ -594,24 +704,38 @@ class PositionManager:
         """
         if not self.config.USE_HARD_STOP:
             return []
+        # Only tracked trades are checked; skip the positions request when flat
+        if not self.active_trades:
+            return []
 
-        stopped = []
-        positions = await self.trader.get_positions()
+        positions = await self._positions_snapshot()
 
-        for pos in positions:
-            if pos.symbol not in self.active_trades:
-                continue
+        # Positions whose loss exceeds the hard stop
+        hard_stop = self.config.HARD_STOP_PCT
+        to_stop = [
+            pos for pos in positions
+            if pos.symbol in self.active_trades and pos.unrealized_plpc <= hard_stop
+        ]
+        if not to_stop:
+            return []
 
-            # Check if loss exceeds hard stop
-            if pos.unrealized_plpc <= self.config.HARD_STOP_PCT:
-                logger.warning(
-                    f"Hard stop triggered: {pos.symbol} "
-                    f"({pos.unrealized_plpc*100:.1f}%)"
-                )
-                trade = await self.close_position(pos.symbol, "stop")
-                if trade:
-                    stopped.append(pos.symbol)
+        for pos in to_stop:
+            logger.warning(
+                f"Hard stop triggered: {pos.symbol} "
+                f"({pos.unrealized_plpc*100:.1f}%)"
+            )
+        # Close concurrently so one slow fill doesn't delay the other stops
+        results = await asyncio.gather(
+            *(self.close_position(pos.symbol, "stop") for pos in to_stop),
+            return_exceptions=True,
+        )
 
+        stopped = []
+        for pos, result in zip(to_stop, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to close {pos.symbol} on hard stop: {result}")
+            elif result:
+                stopped.append(pos.symbol)
         return stopped
 
     def get_daily_summary(self) -> Dict:
@@ -647,20 +771,22 @@ class PositionManager:
         if not dashboard.enabled:
             return
 
-        positions = await self.trader.get_positions()
+        positions = await self._positions_snapshot()
+        active = self.active_trades
         rows = []
         for pos in positions:
-            if pos.symbol in self.active_trades:
-                trade = self.active_trades[pos.symbol]
-                pnl = ((pos.current_price - trade.entry_price) / trade.entry_price) * 100 if trade.entry_price > 0 else 0
-                rows.append([
-                    pos.symbol,
-                    trade.signal_score,
-                    f"${trade.entry_price:.2f}",
-                    f"${pos.current_price:.2f}",
-                    f"{pnl:.2f}%",
-                    "HOLDING",
-                ])
+            trade = active.get(pos.symbol)
+            if trade is None:
+                continue
+            pnl = ((pos.current_price - trade.entry_price) / trade.entry_price) * 100 if trade.entry_price > 0 else 0
+            rows.append([
+                pos.symbol,
+                trade.signal_score,
+                f"${trade.entry_price:.2f}",
+                f"${pos.current_price:.2f}",
+                f"{pnl:.2f}%",
+                "HOLDING",
+            ])
         dashboard.rewrite_positions(rows)
 
     async def open_limit_position(self, setup, max_risk: float) -> Optional[TradeRecord]:
@@ -775,7 +901,7 @@ class PositionManager:
         )
 
         # Persist to DB immediately (so startup sync sees it)
-        db_url = os.environ.get("DATABASE_URL")
+        db_url = self._db_url
         if db_url:
             trade.trade_db_id = log_trade_open(
                 db_url=db_url,
@@ -866,7 +992,7 @@ class PositionManager:
                         cancelled.append(trade)
 
                         # Mark as closed in DB
-                        db_url = os.environ.get("DATABASE_URL")
+                        db_url = self._db_url
                         if db_url and trade.trade_db_id:
                             log_trade_close(
                                 db_url=db_url,
@@ -948,7 +1074,7 @@ class PositionManager:
                 del self._pending_limit_orders[symbol]
                 logger.info(f"EOD: cancelled pending limit order for {symbol}")
 
-                db_url = os.environ.get("DATABASE_URL")
+                db_url = self._db_url
                 if db_url and trade.trade_db_id:
                     log_trade_close(
                         db_url=db_url,
@@ -11,21 +11,23 @@ Usage:
 """
 
 import asyncio
-import json
+import io
 import logging
 import os
 import sys
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
 
-import pytz
+import orjson
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from adapters.alpaca_bars_batch import AlpacaBarsFetcher
+from paper_trading import _ta_kernels
 
-ET = pytz.timezone("America/New_York")
+ET = ZoneInfo("America/New_York")
 
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +35,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent Alpaca bar requests per run (contiguous slices of the symbol list)
+FETCH_SHARDS = 8
+
 # Symbols to track (can be expanded)
 # Start with high-volume options tickers
 DEFAULT_SYMBOLS = [
@@ -61,24 +66,8 @@ DEFAULT_SYMBOLS = [
 
 
 def calculate_rsi(closes: List[float], period: int = 14) -> Optional[float]:
-    """Calculate RSI from closing prices."""
-    if len(closes) < period + 1:
-        return None
-
-    changes = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-    recent = changes[-period:]
-
-    gains = [c if c > 0 else 0 for c in recent]
-    losses = [-c if c < 0 else 0 for c in recent]
-
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-
-    if avg_loss == 0:
-        return 100.0 if avg_gain > 0 else 50.0
-
-    rs = avg_gain / avg_loss
-    return round(100 - (100 / (1 + rs)), 2)
+    """Calculate RSI from closing prices (numba kernel when available)."""
+    return _ta_kernels.rsi(closes, period)
 
 
 def calculate_ema(prices: List[float], period: int) -> Optional[float]:
@@ -96,10 +85,17 @@ def calculate_ema(prices: List[float], period: int) -> Optional[float]:
 
 
 def calculate_sma(prices: List[float], period: int) -> Optional[float]:
-    """Calculate SMA."""
-    if len(prices) < period:
-        return None
-    return round(sum(prices[-period:]) / period, 4)
+    """Calculate SMA (numba kernel when available)."""
+    return _ta_kernels.sma(prices, period)
+
+
+def _ema_prefix_series(prices: List[float], period: int) -> List[float]:
+    """
+    EMA of every prefix prices[:i] (i >= period) in one forward pass.
+
+    Element j equals calculate_ema(prices[:period + j], period).
+    """
+    return [round(ema, 4) for ema in _ta_kernels.ema_prefix_series(prices, period)]
 
 
 def calculate_macd(closes: List[float]) -> tuple:
@@ -107,21 +103,15 @@ def calculate_macd(closes: List[float]) -> tuple:
     if len(closes) < 35:
         return None, None, None
 
-    ema_12 = calculate_ema(closes, 12)
-    ema_26 = calculate_ema(closes, 26)
-
-    if ema_12 is None or ema_26 is None:
-        return None, None, None
+    # Running EMAs for every prefix, instead of re-running EMA from bar 0 per prefix
+    ema_12 = _ema_prefix_series(closes, 12)
+    ema_26 = _ema_prefix_series(closes, 26)
 
-    macd_line = ema_12 - ema_26
+    macd_line = ema_12[-1] - ema_26[-1]
 
-    # Calculate MACD history for signal line
-    macd_values = []
-    for i in range(26, len(closes) + 1):
-        e12 = calculate_ema(closes[:i], 12)
-        e26 = calculate_ema(closes[:i], 26)
-        if e12 and e26:
-            macd_values.append(e12 - e26)
+    # MACD history for signal line: prefixes closes[:26] .. closes[:n]
+    # (ema_12[14] and ema_26[0] are both the 26-bar prefix)
+    macd_values = [e12 - e26 for e12, e26 in zip(ema_12[14:], ema_26) if e12 and e26]
 
     if len(macd_values) < 9:
         return round(macd_line, 4), None, None
@@ -169,13 +159,20 @@ async def generate_ta_cache(
         # SIP requires Alpaca paid data subscription
         feed = "sip"
         logger.info(f"Fetching bars from Alpaca ({feed.upper()} feed) for {len(symbols)} symbols (since {start_date.date()})...")
-        bars_data = await fetcher.get_bars_batch(
-            symbols=symbols,
-            timeframe="1Day",
-            limit=70,  # Extended for 50d SMA calculation
-            start=start_date,
-            feed=feed,
-        )
+        # Concurrent shards on the one fetcher (shared session): each shard paginates on its own
+        size = max(1, -(-len(symbols) // FETCH_SHARDS))
+        shards = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+        results = await asyncio.gather(*[
+            fetcher.get_bars_batch(
+                symbols=shard,
+                timeframe="1Day",
+                limit=70,  # Extended for 50d SMA calculation
+                start=start_date,
+                feed=feed,
+            )
+            for shard in shards
+        ])
+        bars_data = {sym: data for result in results for sym, data in result.items()}
         logger.info(f"Alpaca returned data for {len(bars_data)} symbols")
 
         # Log symbols with no/insufficient data for debugging
@@ -188,6 +185,7 @@ async def generate_ta_cache(
         if symbols_partial:
             logger.warning(f"Symbols with partial data (<15 bars): {len(symbols_partial)} (first 10: {symbols_partial[:10]})")
 
+        updated = datetime.now(ET).isoformat()  # One stamp for the whole batch
         for symbol, bar_data in bars_data.items():
             if not bar_data.bars or len(bar_data.bars) < 15:
                 logger.debug(f"Insufficient data for {symbol}")
@@ -216,7 +214,7 @@ async def generate_ta_cache(
                 "sma_50": sma_50,
                 "last_close": last_close,
                 "trend": trend,
-                "updated": datetime.now(ET).isoformat(),
+                "updated": updated,
             }
 
         logger.info(f"Generated TA for {len(ta_cache)} symbols")
@@ -227,40 +225,31 @@ async def generate_ta_cache(
     return ta_cache
 
 
-def get_tracked_symbols(database_url: str) -> List[str]:
+def get_tracked_symbols(conn) -> List[str]:
     """Fetch tracked symbols from tracked_tickers_v2."""
     try:
-        import psycopg2
-
-        conn = psycopg2.connect(database_url.strip())
         with conn.cursor() as cur:
             cur.execute(
                 "SELECT symbol FROM tracked_tickers_v2 WHERE ta_enabled = TRUE"
             )
             symbols = [row[0] for row in cur.fetchall()]
-        conn.close()
+        conn.commit()
         logger.info(f"Loaded {len(symbols)} tracked symbols from DB")
         return symbols
     except Exception as e:
         logger.warning(f"Failed to load tracked symbols: {e}")
+        if not conn.closed:
+            conn.rollback()  # Leave the shared connection usable for save_to_database
         return []
 
 
-async def save_to_database(ta_cache: Dict) -> bool:
-    """Save TA cache to database."""
-    database_url = os.environ.get("DATABASE_URL")
-    if not database_url:
-        logger.warning("DATABASE_URL not set, skipping database save")
+async def save_to_database(ta_cache: Dict, conn) -> bool:
+    """Save TA cache to database over an open connection (None skips the save)."""
+    if conn is None:
+        logger.warning("No database connection, skipping database save")
         return False
 
     try:
-        import psycopg2
-        from psycopg2.extras import execute_values
-
-        database_url = database_url.strip()
-        conn = psycopg2.connect(database_url)
-        logger.info("Connected to database")
-
         today = datetime.now(ET).date().isoformat()
 
         # Prepare rows
@@ -279,11 +268,21 @@ async def save_to_database(ta_cache: Dict) -> bool:
                 ta.get("sma_50"),
             ))
 
-        # Upsert to database
-        sql = """
-            INSERT INTO ta_daily_close
-            (symbol, trade_date, rsi_14, macd, macd_signal, macd_histogram, sma_20, ema_9, close_price, sma_50)
-            VALUES %s
+        # Stage rows with COPY, then upsert in one statement
+        columns = (
+            "symbol", "trade_date", "rsi_14", "macd", "macd_signal",
+            "macd_histogram", "sma_20", "ema_9", "close_price", "sma_50",
+        )
+        buf = io.StringIO()
+        for row in rows:
+            buf.write("\t".join("\\N" if v is None else str(v) for v in row))
+            buf.write("\n")
+        buf.seek(0)
+
+        col_list = ", ".join(columns)
+        sql = f"""
+            INSERT INTO ta_daily_close ({col_list})
+            SELECT {col_list} FROM _ta_stage
             ON CONFLICT (symbol, trade_date)
             DO UPDATE SET
                 rsi_14 = EXCLUDED.rsi_14,
@@ -296,15 +295,20 @@ async def save_to_database(ta_cache: Dict) -> bool:
         """
 
         with conn.cursor() as cur:
-            execute_values(cur, sql, rows, page_size=100)
+            cur.execute(
+                "CREATE TEMP TABLE _ta_stage (LIKE ta_daily_close INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cur.copy_from(buf, "_ta_stage", columns=columns)
+            cur.execute(sql)
         conn.commit()
-        conn.close()
 
         logger.info(f"Saved {len(rows)} TA records to database")
         return True
 
     except Exception as e:
         logger.error(f"Database save failed: {e}")
+        if not conn.closed:
+            conn.rollback()
         return False
 
 
@@ -322,9 +326,29 @@ async def main():
         logger.error("ALPACA_API_KEY and ALPACA_SECRET_KEY required")
         return
 
-    # Build symbol list: tracked_tickers_v2 ∪ DEFAULT_SYMBOLS
+    # One connection for both the symbol lookup and the TA save
     database_url = os.environ.get("DATABASE_URL", "")
-    tracked = get_tracked_symbols(database_url) if database_url else []
+    conn = None
+    if database_url:
+        try:
+            import psycopg2
+
+            conn = psycopg2.connect(database_url.strip())
+            logger.info("Connected to database")
+        except Exception as e:
+            logger.warning(f"Database connect failed: {e}")
+
+    try:
+        await _run(conn, alpaca_key, alpaca_secret)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+async def _run(conn, alpaca_key: str, alpaca_secret: str):
+    """Build the symbol list, generate the cache and save it."""
+    # Build symbol list: tracked_tickers_v2 ∪ DEFAULT_SYMBOLS
+    tracked = get_tracked_symbols(conn) if conn is not None else []
     symbols = sorted(set(tracked) | set(DEFAULT_SYMBOLS))
     logger.info(
         f"Symbol sources: {len(tracked)} tracked + {len(DEFAULT_SYMBOLS)} default "
@@ -343,7 +367,7 @@ async def main():
         return
 
     # Save to database (if DATABASE_URL is set)
-    await save_to_database(ta_cache)
+    await save_to_database(ta_cache, conn)
 
     # Save to file (for local fallback)
     try:
@@ -358,8 +382,8 @@ async def main():
             "ta_data": ta_cache,
         }
 
-        with open(output_file, "w") as f:
-            json.dump(output_data, f, indent=2)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"TA cache saved to file: {output_file}")
     except Exception as e:
@@ -11,6 +11,7 @@ Applies entry rules to determine if a signal should trigger a trade:
 """
 
 import asyncio
+import concurrent.futures
 import logging
 import os
 from dataclasses import dataclass
@@ -19,11 +20,17 @@ from typing import Optional, List, Dict, Tuple
 
 import pytz
 
+from . import _ta_kernels
 from .config import TradingConfig, DEFAULT_CONFIG
 from .dashboard import get_dashboard, log_active_signal_to_db
 
 logger = logging.getLogger(__name__)
 
+ET = pytz.timezone("America/New_York")
+
+# Bounce day is auto-confirmed on the first signal at/after this time (V29)
+BOUNCE_CONFIRM_TIME = dt_time(9, 31)
+
 # ETFs to exclude — our edge is on individual stocks
 ETF_EXCLUSIONS = {
     # Major index ETFs
@@ -235,6 +242,11 @@ class SignalFilter:
         self._gex_cache: Dict[str, Dict] = {}
         self._gex_cache_loaded = False
 
+        # One long-lived worker for fire-and-forget signal_evaluations inserts
+        self._log_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="signal-eval-log"
+        )
+
         # Adaptive RSI state (V29)
         self._bounce_eligible = False
         self._bounce_checked = False
@@ -542,13 +554,11 @@ class SignalFilter:
         """
         Log signal evaluation to database (non-blocking).
 
-        Runs the DB insert in a thread pool to avoid blocking the event loop.
+        Runs the DB insert on the filter's worker thread to avoid blocking the event loop.
         """
-        import concurrent.futures
         try:
-            # Use a thread pool to run the sync DB call without blocking
-            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-            executor.submit(self._log_evaluation_sync, signal, passed, rejection_reason)
+            # Reuse the shared worker instead of spawning a thread per signal
+            self._log_executor.submit(self._log_evaluation_sync, signal, passed, rejection_reason)
             # Don't wait for result - fire and forget
         except Exception as e:
             logger.debug(f"Failed to submit log evaluation: {e}")
@@ -758,7 +768,7 @@ class SignalFilter:
             self.filter_reasons["etf"] += 1
             # Log and return early - don't waste time on other checks
             self._log_evaluation(signal, False, f"ETF excluded ({signal.symbol})")
-            logger.info(f"Signal FILTERED: {signal.symbol} - ETF excluded")
+            logger.info("Signal FILTERED: %s - ETF excluded", signal.symbol)
             return FilterResult(signal=signal, passed=False, reasons=reasons)
 
         # Check score
@@ -776,9 +786,7 @@ class SignalFilter:
         if (self.config.USE_ADAPTIVE_RSI
                 and self._bounce_eligible
                 and not self._bounce_checked):
-            et = pytz.timezone("America/New_York")
-            now_et = datetime.now(et)
-            if now_et.time() >= dt_time(9, 31):
+            if datetime.now(ET).time() >= BOUNCE_CONFIRM_TIME:
                 self._auto_confirm_bounce_day()
 
         # Check RSI — use effective threshold (50 normal, 60 bounce day)
@@ -915,7 +923,8 @@ class SignalFilter:
         else:
             # Log filtered signals at INFO level now for visibility
             logger.info(
-                f"Signal FILTERED: {signal.symbol} score={signal.score} - {rejection_reason}"
+                "Signal FILTERED: %s score=%s - %s",
+                signal.symbol, signal.score, rejection_reason,
             )
 
         return FilterResult(signal=signal, passed=passed, reasons=reasons)
@@ -1026,6 +1035,7 @@ class SignalGenerator:
         _raw = database_url or os.environ.get("DATABASE_URL")
         self.database_url = _raw.strip() if _raw else None
         self._alpaca_fetcher = None
+        self._price_session = None  # aiohttp session for snapshot prices (lazy)
         self._fetch_lock = asyncio.Lock()
         self._fetched_symbols: set = set()  # Track symbols we've already tried to fetch
 
@@ -1039,7 +1049,7 @@ class SignalGenerator:
         self._gex_cache_loaded = False
 
         # Timezone for market hours check
-        self._et = pytz.timezone("America/New_York")
+        self._et = ET
 
     def _should_use_intraday_ta(self) -> bool:
         """Check if we should use intraday TA (after 9:35 AM ET)."""
@@ -1227,25 +1237,12 @@ class SignalGenerator:
                 return None
 
     def _calculate_rsi(self, closes: List[float], period: int = 14) -> Optional[float]:
-        """Calculate RSI from closing prices."""
-        if len(closes) < period + 1:
-            return None
-        changes = [closes[i] - closes[i-1] for i in range(1, len(closes))]
-        recent = changes[-period:]
-        gains = [c if c > 0 else 0 for c in recent]
-        losses = [-c if c < 0 else 0 for c in recent]
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-        if avg_loss == 0:
-            return 100.0 if avg_gain > 0 else 50.0
-        rs = avg_gain / avg_loss
-        return round(100 - (100 / (1 + rs)), 2)
+        """Calculate RSI from closing prices (numba kernel when available)."""
+        return _ta_kernels.rsi(closes, period)
 
     def _calculate_sma(self, prices: List[float], period: int) -> Optional[float]:
-        """Calculate SMA."""
-        if len(prices) < period:
-            return None
-        return round(sum(prices[-period:]) / period, 4)
+        """Calculate SMA (numba kernel when available)."""
+        return _ta_kernels.sma(prices, period)
 
     def _calculate_ema(self, prices: List[float], period: int) -> Optional[float]:
         """Calculate EMA."""
@@ -1266,12 +1263,11 @@ class SignalGenerator:
         if ema_12 is None or ema_26 is None:
             return None, None, None
         macd_line = ema_12 - ema_26
-        macd_values = []
-        for i in range(26, len(closes) + 1):
-            e12 = self._calculate_ema(closes[:i], 12)
-            e26 = self._calculate_ema(closes[:i], 26)
-            if e12 and e26:
-                macd_values.append(e12 - e26)
+        # MACD for every prefix closes[:26] .. closes[:n] from running EMAs
+        # (one forward pass; same rounded values as _calculate_ema per prefix)
+        e12s = [round(e, 4) for e in _ta_kernels.ema_prefix_series(closes, 12)[14:]]
+        e26s = [round(e, 4) for e in _ta_kernels.ema_prefix_series(closes, 26)]
+        macd_values = [e12 - e26 for e12, e26 in zip(e12s, e26s) if e12 and e26]
         if len(macd_values) < 9:
             return round(macd_line, 4), None, None
         signal_line = self._calculate_ema(macd_values, 9)
@@ -1282,6 +1278,24 @@ class SignalGenerator:
             round(histogram, 4) if histogram else None
         )
 
+    async def _get_price_session(self):
+        """Get or create the keep-alive session for snapshot price fetches."""
+        if self._price_session is None or self._price_session.closed:
+            import aiohttp
+            self._price_session = aiohttp.ClientSession(
+                headers={
+                    "APCA-API-KEY-ID": os.environ.get("ALPACA_API_KEY", ""),
+                    "APCA-API-SECRET-KEY": os.environ.get("ALPACA_SECRET_KEY", ""),
+                },
+                timeout=aiohttp.ClientTimeout(total=5),
+            )
+        return self._price_session
+
+    async def close(self):
+        """Close the price session."""
+        if self._price_session and not self._price_session.closed:
+            await self._price_session.close()
+
     async def _fetch_current_price(self, symbol: str) -> float:
         """
         Fetch current stock price from Alpaca snapshot API.
@@ -1289,35 +1303,27 @@ class SignalGenerator:
         Returns real-time price during market hours, 0 if fetch fails.
         """
         try:
-            import aiohttp
-            api_key = os.environ.get("ALPACA_API_KEY")
-            secret_key = os.environ.get("ALPACA_SECRET_KEY")
-
-            if not api_key or not secret_key:
+            if not os.environ.get("ALPACA_API_KEY") or not os.environ.get("ALPACA_SECRET_KEY"):
                 return 0
 
-            headers = {
-                "APCA-API-KEY-ID": api_key,
-                "APCA-API-SECRET-KEY": secret_key,
-            }
-
+            # Reused across candidates so each fetch skips the TCP/TLS handshake
+            session = await self._get_price_session()
             url = f"https://data.alpaca.markets/v2/stocks/{symbol}/snapshot"
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=5)) as resp:
-                    if resp.status != 200:
-                        return 0
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    return 0
 
-                    data = await resp.json()
-                    # Use latest trade price, or daily bar close as fallback
-                    latest_trade = data.get("latestTrade", {})
-                    if latest_trade.get("p"):
-                        return float(latest_trade["p"])
+                data = await resp.json()
+                # Use latest trade price, or daily bar close as fallback
+                latest_trade = data.get("latestTrade", {})
+                if latest_trade.get("p"):
+                    return float(latest_trade["p"])
 
-                    daily_bar = data.get("dailyBar", {})
-                    if daily_bar.get("c"):
-                        return float(daily_bar["c"])
+                daily_bar = data.get("dailyBar", {})
+                if daily_bar.get("c"):
+                    return float(daily_bar["c"])
 
-                    return 0
+                return 0
         except Exception as e:
             logger.debug(f"Failed to fetch price for {symbol}: {e}")
             return 0
@@ -83,44 +83,53 @@ class TradeAggregator:
 
         Parses OCC symbol and aggregates by underlying.
         """
-        # Parse OCC symbol
-        match = OCC_REGEX.match(trade.symbol)
-        if not match:
-            return
-
-        underlying = match.group(1)
-        right = "call" if match.group(3) == "C" else "put"
-        strike = int(match.group(4)) / 1000
-
-        # Convert to TradeData
-        trade_data = TradeData(
-            underlying=underlying,
-            option_symbol=trade.symbol,
-            price=trade.price,
-            size=trade.size,
-            timestamp=trade.timestamp / 1000  # Convert ms to seconds
-        )
-
-        # Add to rolling aggregator
-        self._aggregator.add_trade(trade_data)
-
-        # Update symbol state for scoring
-        state = self._symbol_state[underlying]
-        state.symbol = underlying
-        state.total_contracts += trade.size
+        self.add_trades((trade,))
 
-        notional = trade.price * trade.size * 100
-        if right == "call":
-            state.call_notional += notional
-        else:
-            state.put_notional += notional
+    def add_trades(self, trades: List[Trade]):
+        """
+        Add a batch of trades from firehose.
 
-        # Track sweeps (condition 209)
-        if 209 in trade.conditions:
-            state.sweep_notional += notional
+        Same per-trade work as add_trade, with lookups hoisted out of the
+        loop so a drained queue burst costs one call.
+        """
+        match_occ = OCC_REGEX.match
+        add_to_window = self._aggregator.add_trade
+        symbol_state = self._symbol_state
+
+        for trade in trades:
+            # Parse OCC symbol
+            match = match_occ(trade.symbol)
+            if not match:
+                continue
 
-        # Track strike concentration
-        state.unique_strikes.add(strike)
+            underlying, _, right, strike_digits = match.groups()
+
+            # Add to rolling aggregator
+            add_to_window(TradeData(
+                underlying=underlying,
+                option_symbol=trade.symbol,
+                price=trade.price,
+                size=trade.size,
+                timestamp=trade.timestamp / 1000  # Convert ms to seconds
+            ))
+
+            # Update symbol state for scoring
+            state = symbol_state[underlying]
+            state.symbol = underlying
+            state.total_contracts += trade.size
+
+            notional = trade.price * trade.size * 100
+            if right == "C":
+                state.call_notional += notional
+            else:
+                state.put_notional += notional
+
+            # Track sweeps (condition 209)
+            if 209 in trade.conditions:
+                state.sweep_notional += notional
+
+            # Track strike concentration
+            state.unique_strikes.add(int(strike_digits) / 1000)
 
     def get_baseline(self, symbol: str) -> float:
         """Get baseline notional for a symbol."""
@@ -11,6 +11,7 @@ Tasks:
 3. Update baseline cache for next trading day
 4. Refresh adv_14d (14-day average daily volume)
 5. Refresh flow_signals (engulfing pattern + options flow alignment)
+6. Refresh baselines_20d materialized view (engine startup baselines)
 
 Usage:
     python -m scripts.refresh_baselines
@@ -92,6 +93,9 @@ class BaselineRefreshJob:
             # Step 6: Refresh flow_signals (engulfing + options flow alignment)
             await self._refresh_flow_signals()
 
+            # Step 7: Refresh baselines_20d (read by paper trading engine at startup)
+            await self._refresh_baselines_20d()
+
         except Exception as e:
             logger.error(f"Refresh job failed: {e}")
             self.stats['errors'] += 1
@@ -264,6 +268,23 @@ class BaselineRefreshJob:
             logger.error(f"adv_14d refresh failed: {e}")
             self.stats['errors'] += 1
 
+    async def _refresh_baselines_20d(self):
+        """Refresh the baselines_20d materialized view (see sql/create_baselines_20d.sql)."""
+        logger.info("Refreshing baselines_20d materialized view...")
+
+        try:
+            async with self.db_pool.acquire() as conn:
+                await conn.execute(
+                    "REFRESH MATERIALIZED VIEW CONCURRENTLY baselines_20d",
+                    timeout=300,
+                )
+                count = await conn.fetchval("SELECT COUNT(*) FROM baselines_20d")
+                logger.info(f"baselines_20d refreshed: {count} symbols")
+
+        except Exception as e:
+            logger.error(f"baselines_20d refresh failed: {e}")
+            self.stats['errors'] += 1
+
     async def _refresh_flow_signals(self):
         """Join engulfing_scores (daily) with orats_daily options flow and upsert to flow_signals.
 
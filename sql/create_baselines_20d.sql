@@ -0,0 +1,20 @@
+-- baselines_20d: 20-day average 30-min notional per symbol (regular session)
+-- Precomputed from intraday_baselines_30m so engine startup reads O(symbols) rows
+-- Refreshed by refresh_baselines.py (daily 4:30 PM ET job)
+-- Consumed by paper_trading/main.py load_baselines()
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS baselines_20d AS
+SELECT
+    symbol,
+    AVG(notional) AS avg_notional
+FROM intraday_baselines_30m
+WHERE trade_date > CURRENT_DATE - 20
+  AND bucket_start BETWEEN '09:30' AND '16:00'
+GROUP BY symbol
+HAVING AVG(notional) > 0;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_baselines_20d_symbol ON baselines_20d(symbol);
+
+-- REFRESH requires ownership, so the app role (which runs the refresh job) owns it
+ALTER MATERIALIZED VIEW baselines_20d OWNER TO fr3_app;
@@ -0,0 +1,24 @@
+-- tracked_tickers_changed: NOTIFY when the TA-enabled watchlist changes
+-- Listened to by paper_trading/main.py to invalidate its cached symbol list
+-- (bar collection). Only membership changes notify: new symbols, deletes, and
+-- ta_enabled flips. Routine trigger_count/last_trigger_ts upserts stay silent.
+
+CREATE OR REPLACE FUNCTION notify_tracked_tickers_changed() RETURNS trigger AS $$
+BEGIN
+    -- Identical payloads are collapsed per transaction, so bulk inserts notify once
+    PERFORM pg_notify('tracked_tickers_changed', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_tracked_tickers_insert_delete ON tracked_tickers_v2;
+CREATE TRIGGER trg_tracked_tickers_insert_delete
+    AFTER INSERT OR DELETE ON tracked_tickers_v2
+    FOR EACH ROW EXECUTE FUNCTION notify_tracked_tickers_changed();
+
+DROP TRIGGER IF EXISTS trg_tracked_tickers_ta_enabled ON tracked_tickers_v2;
+CREATE TRIGGER trg_tracked_tickers_ta_enabled
+    AFTER UPDATE OF ta_enabled ON tracked_tickers_v2
+    FOR EACH ROW
+    WHEN (OLD.ta_enabled IS DISTINCT FROM NEW.ta_enabled)
+    EXECUTE FUNCTION notify_tracked_tickers_changed();
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+AlpacaTrader Unit Tests
+
+Covers order fill polling (wait_for_fill) and the batched latest-price
+lookup (get_latest_prices) against a mocked HTTP session. No network.
+
+Usage:
+    python -m pytest tests/test_alpaca_trader.py -q
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("aiohttp")
+
+from paper_trading import alpaca_trader
+from paper_trading.alpaca_trader import AlpacaTrader, OrderStatus
+
+
+class FakeResponse:
+    """Minimal aiohttp response: async context manager with status/json/text."""
+
+    def __init__(self, status: int = 200, payload=None):
+        self.status = status
+        self._payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self._payload
+
+    async def text(self):
+        return str(self._payload)
+
+
+class FakeSession:
+    """Serves queued responses to session.get(); the last one repeats."""
+
+    closed = False
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        if len(self.responses) > 1:
+            return self.responses.pop(0)
+        return self.responses[0]
+
+
+def order_json(status: str, filled_avg_price=None) -> dict:
+    return {
+        "id": "order-1",
+        "symbol": "AAPL",
+        "qty": "10",
+        "side": "buy",
+        "type": "market",
+        "status": status,
+        "filled_qty": "10" if status == "filled" else "0",
+        "filled_avg_price": filled_avg_price,
+        "submitted_at": "2026-01-02T14:30:00Z",
+    }
+
+
+def make_trader(responses) -> AlpacaTrader:
+    trader = AlpacaTrader("key", "secret")
+    trader._session = FakeSession(responses)
+    return trader
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record wait_for_fill's poll delays (still really sleeping)."""
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(delay):
+        delays.append(delay)
+        await real_sleep(delay)
+
+    monkeypatch.setattr(alpaca_trader.asyncio, "sleep", recording_sleep)
+    return delays
+
+
+# --- wait_for_fill ---
+
+def test_wait_for_fill_backs_off_until_filled(sleeps):
+    trader = make_trader([
+        FakeResponse(200, order_json("new")),
+        FakeResponse(200, order_json("partially_filled")),
+        FakeResponse(200, order_json("filled", "190.25")),
+    ])
+
+    order = asyncio.run(trader.wait_for_fill("order-1", timeout=5.0))
+
+    assert order.status == OrderStatus.FILLED
+    assert order.filled_avg_price == 190.25
+    assert sleeps == [0.1, 0.2, 0.4]
+    assert len(trader._session.calls) == 3
+    assert trader._session.calls[0][0].endswith("/v2/orders/order-1")
+
+
+@pytest.mark.parametrize("status", ["canceled", "rejected"])
+def test_wait_for_fill_returns_on_terminal_status(sleeps, status):
+    trader = make_trader([FakeResponse(200, order_json(status))])
+
+    order = asyncio.run(trader.wait_for_fill("order-1", timeout=5.0))
+
+    assert order.status == OrderStatus(status)
+    assert order.filled_avg_price is None
+    assert sleeps == [0.1]
+
+
+def test_wait_for_fill_timeout_returns_last_order(sleeps):
+    trader = make_trader([FakeResponse(200, order_json("new"))])
+
+    order = asyncio.run(trader.wait_for_fill("order-1", timeout=0.5))
+
+    assert order.status == OrderStatus.NEW
+    # Doubling from 100ms, with the final poll clipped to the time remaining
+    assert sleeps[:2] == [0.1, 0.2]
+    assert all(d <= 1.0 for d in sleeps)
+    assert sum(sleeps) == pytest.approx(0.5, abs=0.05)
+
+
+def test_wait_for_fill_keeps_last_order_when_a_poll_fails(sleeps):
+    trader = make_trader([
+        FakeResponse(200, order_json("new")),
+        FakeResponse(500, None),
+    ])
+
+    order = asyncio.run(trader.wait_for_fill("order-1", timeout=0.5))
+
+    assert order is not None
+    assert order.status == OrderStatus.NEW
+
+
+def test_wait_for_fill_timeout_with_no_order_returns_none(sleeps):
+    trader = make_trader([FakeResponse(404, None)])
+
+    assert asyncio.run(trader.wait_for_fill("order-1", timeout=0.3)) is None
+
+
+# --- get_latest_prices ---
+
+def test_get_latest_prices_parses_multi_symbol_response():
+    trader = make_trader([FakeResponse(200, {
+        "trades": {
+            "AAPL": {"p": 190.5, "s": 100},
+            "TSLA": {"p": 250, "s": 5},
+            "ZERO": {"p": 0},
+            "NOPX": {"s": 10},
+        }
+    })])
+
+    prices = asyncio.run(trader.get_latest_prices(["AAPL", "TSLA", "ZERO", "NOPX", "MISSING"]))
+
+    assert prices == {"AAPL": 190.5, "TSLA": 250.0}
+    assert isinstance(prices["TSLA"], float)
+    url, params = trader._session.calls[0]
+    assert url.endswith("/stocks/trades/latest")
+    assert params == {"symbols": "AAPL,TSLA,ZERO,NOPX,MISSING"}
+
+
+def test_get_latest_prices_error_status_returns_empty():
+    trader = make_trader([FakeResponse(429, {"message": "too many requests"})])
+
+    assert asyncio.run(trader.get_latest_prices(["AAPL"])) == {}
+
+
+def test_get_latest_prices_no_symbols_skips_request():
+    trader = make_trader([FakeResponse(200, {"trades": {}})])
+
+    assert asyncio.run(trader.get_latest_prices([])) == {}
+    assert trader._session.calls == []
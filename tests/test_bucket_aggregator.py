@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+BucketAggregator Unit Tests
+
+Covers detaching the live bucket (take_bucket) and flush retry behaviour
+(failed flushes re-queue their rows for the next flush) with a mocked pool.
+
+Usage:
+    python -m pytest tests/test_bucket_aggregator.py -q
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("websockets")  # firehose/__init__ imports the websocket client
+
+from firehose.bucket_aggregator import BucketAggregator
+
+TS = datetime(2026, 1, 2, 10, 5)
+
+
+class FakeConn:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def executemany(self, sql, rows):
+        if self.pool.failures:
+            self.pool.failures -= 1
+            raise RuntimeError("connection reset")
+        self.pool.inserted.append(list(rows))
+
+
+class FakeAcquire:
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def __aenter__(self):
+        return FakeConn(self.pool)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakePool:
+    """asyncpg-style pool whose first `failures` executemany calls raise."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.inserted = []
+
+    def acquire(self):
+        return FakeAcquire(self)
+
+
+def add(agg: BucketAggregator, underlying: str, right: str = "C", size: int = 1):
+    agg.add_trade(
+        underlying=underlying,
+        option_symbol=f"O:{underlying}260116{right}00150000",
+        price=2.0,
+        size=size,
+        timestamp=TS,
+    )
+
+
+# --- take_bucket ---
+
+def test_take_bucket_detaches_current_stats():
+    agg = BucketAggregator()
+    add(agg, "AAPL", size=3)
+    add(agg, "AAPL", "P", size=2)
+    add(agg, "TSLA")
+
+    taken = agg.take_bucket()
+
+    assert sorted(b.symbol for b in taken) == ["AAPL", "TSLA"]
+    aapl = next(b for b in taken if b.symbol == "AAPL")
+    assert (aapl.prints, aapl.call_volume, aapl.put_volume) == (2, 3, 2)
+    assert agg.get_pending_count() == 0
+
+
+def test_trades_after_take_bucket_start_fresh_stats():
+    agg = BucketAggregator()
+    add(agg, "AAPL")
+    taken = agg.take_bucket()
+
+    add(agg, "AAPL", size=5)
+
+    assert taken[0].prints == 1 and taken[0].contracts == 1
+    live = agg._current_bucket["AAPL"]
+    assert live is not taken[0]
+    assert (live.prints, live.contracts) == (1, 5)
+
+
+# --- flush ---
+
+def test_flush_without_buckets_detaches_live_bucket():
+    pool = FakePool()
+    agg = BucketAggregator(db_pool=pool)
+    add(agg, "AAPL")
+    add(agg, "TSLA")
+
+    rows = asyncio.run(agg.flush())
+
+    assert rows == 2
+    assert sorted(r[0] for r in pool.inserted[0]) == ["AAPL", "TSLA"]
+    assert agg.get_pending_count() == 0
+
+
+def test_flush_of_taken_buckets_leaves_live_bucket_alone():
+    pool = FakePool()
+    agg = BucketAggregator(db_pool=pool)
+    add(agg, "AAPL")
+    taken = agg.take_bucket()
+    add(agg, "TSLA")
+
+    rows = asyncio.run(agg.flush(taken))
+
+    assert rows == 1
+    assert [r[0] for r in pool.inserted[0]] == ["AAPL"]
+    assert list(agg._current_bucket) == ["TSLA"]
+
+
+def test_failed_flush_requeues_buckets_for_next_flush():
+    pool = FakePool(failures=1)
+    agg = BucketAggregator(db_pool=pool)
+    add(agg, "AAPL")
+    first = agg.take_bucket()
+
+    assert asyncio.run(agg.flush(first)) == 0
+    assert agg._retry_buckets == first
+    assert pool.inserted == []
+
+    add(agg, "TSLA")
+    rows = asyncio.run(agg.flush(agg.take_bucket()))
+
+    assert rows == 2
+    assert [r[0] for r in pool.inserted[0]] == ["AAPL", "TSLA"]
+    assert agg._retry_buckets == []
+
+
+def test_failed_flush_keeps_retrying_accumulated_rows():
+    pool = FakePool(failures=2)
+    agg = BucketAggregator(db_pool=pool)
+    add(agg, "AAPL")
+    asyncio.run(agg.flush())
+    add(agg, "TSLA")
+    asyncio.run(agg.flush())
+
+    assert sorted(b.symbol for b in agg._retry_buckets) == ["AAPL", "TSLA"]
+
+    assert asyncio.run(agg.flush()) == 2
+    assert agg._retry_buckets == []
+    assert agg.get_metrics()["total_rows_inserted"] == 2